@@ -0,0 +1,5 @@
+import sys
+
+from SCF_method.cli import main
+
+sys.exit(main())
@@ -39,6 +39,18 @@ class RootBasis(ABC):
         for base in self.basis_set:
             yield base
 
+    def is_centered_on(self, nuclei_positions: np.ndarray, tolerance: float = 1e-3) -> bool:
+        """
+        Basis centers are defined independently of the molecule in input data,
+        this method checks that i-th center of the basis is i-th nucleus of the molecule
+        :param nuclei_positions: ndarray of coordinates for system of nuclei of the molecule
+        :param tolerance: float, maximum distance of basis center and nucleus
+        :return: bool
+        """
+        nuclei_positions = np.array(nuclei_positions)
+        return self.nuclei_positions.shape == nuclei_positions.shape and \
+            np.allclose(self.nuclei_positions, nuclei_positions, rtol=0, atol=tolerance)
+
     @abstractmethod
     def _create_basis_set(self, *args, **kwargs):
         """
@@ -61,6 +73,36 @@ class RootBasis(ABC):
         """
         pass
 
+    @abstractmethod
+    def center_indices(self) -> np.ndarray:
+        """
+        Each basis function is centered on one of the nuclei, this method should return
+        the index of the nucleus for every element of the basis set
+        :return: ndarray of integers, array.shape = (len(basis),)
+        """
+        pass
+
+    @abstractmethod
+    def derivative(self, index: int, axis: int) -> Callable:
+        """
+        Derivative of basis function with respect to the coordinate of its own center
+        This is used for calculation of derivative integrals (nuclear gradients)
+        :param index: int, index of basis function in the basis set
+        :param axis: int, coordinate of the center (0, 1, 2 for x, y, z)
+        :return: function of r, r.shape = (N,3), where N is arbitrary integer
+        """
+        pass
+
+    @abstractmethod
+    def move_nuclei(self, nuclei_positions: np.ndarray):
+        """
+        Basis functions have to follow the nuclei when the molecular geometry is changed
+        This method should redefine the basis set for new positions of nuclei
+        :param nuclei_positions: ndarray of new coordinates for system of nuclei
+        :return: None
+        """
+        pass
+
 
 class GaussianBasis(RootBasis):
     """
@@ -81,7 +123,23 @@ class GaussianBasis(RootBasis):
             return norm*np.exp(-alpha*np.sum((r-r0)**2, axis=1))
         return gauss
 
+    @staticmethod
+    def gaussian_base_derivative(alpha: float, r0: np.ndarray, norm: float, axis: int) -> Callable:
+        """
+        Derivative of the gaussian base element with respect to coordinate of its center:
+        d/dR0 N*exp( -alpha * (r - R0)**2 ) = 2*alpha*(r - R0)*N*exp( -alpha * (r - R0)**2 )
+        :param alpha: float coefficient from the definition
+        :param r0: ndarray of coordinates for specific nucleus
+        :param norm: float normalization coefficient
+        :param axis: int, coordinate of the center (0, 1, 2 for x, y, z)
+        :return: function of r, r.shape = (N,3), where N is arbitrary integer
+        """
+        def gauss_derivative(r):
+            return 2*alpha*(r[:, axis]-r0[axis])*norm*np.exp(-alpha*np.sum((r-r0)**2, axis=1))
+        return gauss_derivative
+
     def _create_basis_set(self,  alphas: List, nuclei_position: np.ndarray, normalization_factors: List) -> List:
+        self.alphas = np.array(alphas)
         basis_set = []
         for i, R in enumerate(nuclei_position):
             for j, alpha in enumerate(alphas):
@@ -101,4 +159,34 @@ class GaussianBasis(RootBasis):
                                                 nuclei_position=self.nuclei_positions,
                                                 *self.args, **self.kwargs)
 
+    def center_indices(self) -> np.ndarray:
+        """
+        Basis set is ordered by nuclei, every nucleus carries one function for each alpha
+        :return: ndarray of integers, array.shape = (len(basis),)
+        """
+        return np.repeat(np.arange(len(self.nuclei_positions)), len(self.alphas))
+
+    def derivative(self, index: int, axis: int) -> Callable:
+        """
+        Derivative of basis function with respect to the coordinate of its own center
+        :param index: int, index of basis function in the basis set
+        :param axis: int, coordinate of the center (0, 1, 2 for x, y, z)
+        :return: function of r, r.shape = (N,3), where N is arbitrary integer
+        """
+        i, j = divmod(index, len(self.alphas))
+        return self.gaussian_base_derivative(self.alphas[j],
+                                             self.nuclei_positions[i],
+                                             self.normalization_factors[i][j],
+                                             axis)
 
+    def move_nuclei(self, nuclei_positions: np.ndarray):
+        """
+        Normalization of gaussian functions does not depend on the position of its center,
+        therefore current normalization factors are kept
+        :param nuclei_positions: ndarray of new coordinates for system of nuclei
+        :return: None
+        """
+        self.nuclei_positions = np.array(nuclei_positions)
+        self.basis_set = self._create_basis_set(normalization_factors=self.normalization_factors,
+                                                nuclei_position=self.nuclei_positions,
+                                                *self.args, **self.kwargs)
@@ -46,7 +46,7 @@ class SelfConsistentFieldCalculation:
         self.V_nuc = V_nuc  # Step 2. Molecular integrals
         self.mnls = mnls  # Step 2. Molecular integrals
         self.convergence_config = convergence_config
-        self.P = P if P else np.identity(T.shape[0])  # Step 4. Density matrix initial guess
+        self.P = P if P is not None else np.identity(T.shape[0])  # Step 4. Density matrix initial guess
         s, U = np.linalg.eig(S)  # Step 3. Diagonalization of overlap matrix
         self.X = U@np.diag(s**(-0.5))@U.T  # Step 3. Diagonalization of overlap matrix
         self.G = self.calculate_g_matrix()  # Step 5. Calculation of G matrix
@@ -91,7 +91,9 @@ class SelfConsistentFieldCalculation:
 
     def calculate_c_matrix(self) -> Tuple:
         F_prime = self.X.T @ self.F @ self.X  # Step 7. Calculation of transformed Fock Matrix
-        E, C_prime = np.linalg.eig(F_prime)  # Step 8. Diagonalization of transformed Fock Matrix
+        # Step 8. Diagonalization of transformed Fock Matrix, eigh returns orbital energies in ascending order,
+        # therefore the first N/2 columns of C are always the occupied orbitals
+        E, C_prime = np.linalg.eigh(F_prime)
         C = self.X @ C_prime  # Step 9. Calculation of coefficient matrix
         return C, E
 
@@ -103,6 +105,24 @@ class SelfConsistentFieldCalculation:
                     P[mu, nu] += 2 * self.C[mu, a] * self.C[nu, a]
         return P
 
+    def calculate_energy_weighted_density_matrix(self) -> np.ndarray:
+        """
+        Energy weighted density matrix is used in calculation of nuclear gradients:
+        Attila Szabo, Neil S. Ostlund; Modern Quantum Chemistry; page 440
+        Occupied orbitals are chosen in the same way as in the electron density matrix
+        :return: ndarray, array.shape = (len(basis),len(basis))
+        """
+        C_occupied = self.C[:, :self.N // 2]
+        return 2 * (C_occupied * self.E[:self.N // 2]) @ C_occupied.T
+
+    def electronic_energy(self) -> float:
+        """
+        Electronic energy of the current state:
+        Attila Szabo, Neil S. Ostlund; Modern Quantum Chemistry; page 150
+        :return: float
+        """
+        return 0.5 * np.sum(self.P * (self.T + self.V_nuc + self.F))
+
     def convergence_criterion(self) -> bool:
         """
         Convergence consideration according to the literature:
@@ -0,0 +1,69 @@
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+class MolecularOrbitalTransformation:
+    """
+    Transformation of two electron interaction matrix mnls from atomic orbital (basis) to molecular orbital basis:
+    (pq|rs) = SUM C[m, p] * C[n, q] * C[l, r] * C[s, s'] * mnls[m, n, l, s']
+    Transformation is done as four sequential quarter transformations, each of them costs O(N^5)
+    instead of O(N^8) for the direct summation
+    """
+    def __init__(self, mnls: np.ndarray, C: np.ndarray):
+        """
+        :param mnls: ndarray, Two electron interaction matrix in atomic orbital basis
+        :param C: ndarray, Coefficient matrix, columns are molecular orbitals
+        """
+        self.mnls = mnls
+        self.C = C
+
+    @staticmethod
+    def quarter_transform(tensor: np.ndarray, C: np.ndarray, axis: int) -> np.ndarray:
+        """
+        Transformation of one index of the tensor
+        :param tensor: ndarray with four indices
+        :param C: ndarray, coefficients of molecular orbitals array.shape = (len(basis), number of orbitals)
+        :param axis: int, index of the tensor which is transformed
+        :return: ndarray, transformed index is replaced by molecular orbital index at the same position
+        """
+        return np.moveaxis(np.tensordot(tensor, C, axes=([axis], [0])), -1, axis)
+
+    def transform(self, C_1: np.ndarray, C_2: np.ndarray, C_3: np.ndarray, C_4: np.ndarray) -> np.ndarray:
+        """
+        Transformation of all four indices, every index may be transformed to different set of orbitals
+        :param C_1: ndarray, coefficients of molecular orbitals for the first index
+        :param C_2: ndarray, coefficients of molecular orbitals for the second index
+        :param C_3: ndarray, coefficients of molecular orbitals for the third index
+        :param C_4: ndarray, coefficients of molecular orbitals for the fourth index
+        :return: ndarray where array.shape = (C_1.shape[1], C_2.shape[1], C_3.shape[1], C_4.shape[1])
+        """
+        tensor = self.quarter_transform(self.mnls, C_1, 0)
+        tensor = self.quarter_transform(tensor, C_2, 1)
+        tensor = self.quarter_transform(tensor, C_3, 2)
+        return self.quarter_transform(tensor, C_4, 3)
+
+    def full_transform(self) -> np.ndarray:
+        """
+        :return: ndarray, two electron interaction matrix in molecular orbital basis
+        """
+        return self.transform(self.C, self.C, self.C, self.C)
+
+    def ovov_blocks(self, n_occupied: int, block_size: int = None) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Blocks of (ia|jb) integrals, where i, j are occupied and a, b are virtual orbitals
+        Only block_size occupied orbitals i are transformed at once, so that the largest
+        intermediate array has block_size * len(basis)**3 elements
+        Occupied orbitals are the first n_occupied columns of C
+        :param n_occupied: int, number of occupied orbitals
+        :param block_size: int, number of occupied orbitals i in one block, all of them if None
+        :return: iterator of (slice of orbitals i, ndarray (ia|jb) where array.shape = (block, virtual, occupied, virtual))
+        """
+        if block_size is not None and block_size < 1:
+            raise ValueError(f"Block size has to be a positive integer, got {block_size}")
+        C_occupied = self.C[:, :n_occupied]
+        C_virtual = self.C[:, n_occupied:]
+        block_size = block_size if block_size is not None else n_occupied
+        for start in range(0, n_occupied, block_size):
+            block = slice(start, min(start + block_size, n_occupied))
+            yield block, self.transform(C_occupied[:, block], C_virtual, C_occupied, C_virtual)
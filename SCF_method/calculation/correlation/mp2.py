@@ -0,0 +1,52 @@
+import numpy as np
+
+from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
+from SCF_method.calculation.correlation.mo_transformation import MolecularOrbitalTransformation
+from SCF_method.logger import SCF_logger
+
+
+class MollerPlessetEnergy:
+    """
+    Second order Moller-Plesset (MP2) correlation energy of closed shell system:
+    E_MP2 = SUM (ia|jb) * [2*(ia|jb) - (ib|ja)] / (e_i + e_j - e_a - e_b)
+    This procedure is described in : Attila Szabo, Neil S. Ostlund; Modern Quantum Chemistry; page 352
+    Only (ia|jb) integrals are transformed to molecular orbital basis, blocked over occupied orbitals i
+    Occupied orbitals are chosen in the same way as in the electron density matrix (the first N/2 orbitals)
+    and have to be lower in energy than all virtual orbitals
+    """
+    def __init__(self,
+                 SCF_obj: SelfConsistentFieldCalculation,
+                 block_size: int = None):
+        """
+        :param SCF_obj: SelfConsistentFieldCalculation, state of the converged SCF calculation
+        :param block_size: int, number of occupied orbitals transformed at once, all of them if None
+        """
+        self.SCF_obj = SCF_obj
+        self.block_size = block_size
+        SCF_logger.info("Calculating MP2 correlation energy")
+        self.energy = self._calculate_self()
+
+    def _calculate_self(self) -> float:
+        """
+        Calculation of MP2 correlation energy itself
+        :return: float
+        """
+        n_occupied = self.SCF_obj.N // 2
+        E = np.real(self.SCF_obj.E)
+        C = np.real(self.SCF_obj.C)
+        e_occupied = E[:n_occupied]
+        e_virtual = E[n_occupied:]
+        if not e_virtual.size:
+            SCF_logger.info("There are no virtual orbitals: MP2 correlation energy is 0")
+            return 0.
+        if np.max(e_occupied) >= np.min(e_virtual):
+            raise ValueError(f"Occupied orbitals are not the lowest ones (highest occupied energy {np.max(e_occupied)}, "
+                             f"lowest virtual energy {np.min(e_virtual)}), MP2 denominators are not negative")
+        transformation = MolecularOrbitalTransformation(self.SCF_obj.mnls, C)
+        energy = 0.
+        for block, iajb in transformation.ovov_blocks(n_occupied, self.block_size):
+            denominator = (e_occupied[block, None, None, None] - e_virtual[None, :, None, None]
+                           + e_occupied[None, None, :, None] - e_virtual[None, None, None, :])
+            energy += np.sum(iajb * (2 * iajb - iajb.transpose(0, 3, 2, 1)) / denominator)
+        SCF_logger.info(f"MP2 correlation energy is {energy}")
+        return energy
@@ -0,0 +1,48 @@
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.matrices.kinetic_energy_matrix import KineticEnergy
+from SCF_method.logger import SCF_logger
+
+
+class KineticEnergyDerivative(KineticEnergy):
+    """
+    This class represents derivative of kinetic energy matrix with respect to nuclei positions
+    Kinetic energy matrix is integrated only for i <= j as base_i*laplace(base_j), numerical estimate of [i, j]
+    is not exactly equal to estimate of base_j*laplace(base_i), therefore both halves of the derivative are integrated:
+    element [x, i, j] is derivative of T[i, j] with respect to coordinate x of the center of base_i only,
+    diagonal element [x, i, i] is half of the derivative of T[i, i]
+    Derivative of the whole matrix is assembled in the gradient calculation as 2*SUM P*dT
+    """
+    def __init__(self,
+                 basis: RootBasis,
+                 integrator: BaseIntegrator):
+        """
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        """
+        self.basis = basis
+        self.integrator = integrator
+        SCF_logger.info("Calculating dT - kinetic energy derivative matrix")
+        self.matrix = self._calculate_self()
+
+    def _calculate_self(self) -> np.ndarray:
+        """
+        Calculation of kinetic energy derivative matrix itself
+        :return: ndarray where array.shape = (3, len(basis), len(basis))
+        """
+        basis_length = len(self.basis)
+        dT = np.zeros([3, basis_length, basis_length])
+        for x in range(3):
+            for i, base_i in enumerate(self.basis):
+                d_base_i = self.basis.derivative(i, x)
+                for j in range(i, basis_length):
+                    t_i = self.integrator.integrate(self._integrand(d_base_i, self.basis[j]))
+                    t_j = self.integrator.integrate(self._integrand(base_i, self.basis.derivative(j, x)))
+                    if i == j:
+                        dT[x, i, j] = (t_i + t_j) / 2
+                    else:
+                        dT[x, i, j] = t_i
+                        dT[x, j, i] = t_j
+        return dT
@@ -0,0 +1,104 @@
+from typing import Callable
+
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.matrices.nuclear_attraction_matrix import NuclearAttraction
+from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.logger import SCF_logger
+
+
+class NuclearAttractionDerivative(NuclearAttraction):
+    """
+    This class represents derivative of nuclear potential energy matrix with respect to nuclei positions
+    Matrix element [x, i, j] is integral of derivative of base_i (with respect to coordinate x of its center)
+    multiplied by V_nuclear * base_j
+    Moving of the nucleus also changes the potential itself, this term is stored in operator_matrix
+    """
+    def __init__(self,
+                 molecule: Molecule,
+                 basis: RootBasis,
+                 integrator: BaseIntegrator):
+        """
+        :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        """
+        self.molecule = molecule
+        self.basis = basis
+        self.integrator = integrator
+        self._potential_samples = None
+        self._potential_values = None
+        SCF_logger.info("Calculating dV_nuc - nuclear attraction derivative matrix")
+        self.matrix = self._calculate_self()
+        self.operator_matrix = self._calculate_operator_derivative()
+
+    def nuclear_coulomb_force(self, a: int, axis: int) -> Callable:
+        """
+        Derivative of the Coulombic potential of nucleus a with respect to coordinate of its position:
+        d/dRa ( - Za / abs( r - Ra ) ) = - Za * (r - Ra) / abs( r - Ra )**3
+        :param a: int, index of nucleus in molecule
+        :param axis: int, coordinate of the nucleus (0, 1, 2 for x, y, z)
+        :return: function of r, r.shape = (N,3)
+        """
+        Z = self.molecule.atomic_numbers[a]
+        R = self.molecule.nuclei_positions[a]
+
+        def force(r: np.ndarray):
+            return -Z * (r[:, axis] - R[axis]) / np.sqrt(np.sum((r - R) ** 2, axis=1)) ** 3
+
+        return force
+
+    @staticmethod
+    def cached_coulomb_force(force: Callable) -> Callable:
+        """
+        Force which is evaluated only once for given block of samples
+        Force does not depend on the matrix element, therefore it is reused for all (i, j) pairs
+        as long as integrator passes the same samples array
+        :param force: function of r, r.shape = (N,3)
+        :return: function of r, r.shape = (N,3)
+        """
+        cache = {"samples": None, "values": None}
+
+        def cached_force(r: np.ndarray):
+            if r is not cache["samples"]:
+                cache["samples"] = r
+                cache["values"] = force(r)
+            return cache["values"]
+
+        return cached_force
+
+    def _calculate_self(self) -> np.ndarray:
+        """
+        Calculation of nuclear Coulombic energy derivative matrix itself
+        :return: ndarray where array.shape = (3, len(basis), len(basis))
+        """
+        basis_length = len(self.basis)
+        dV_nuc = np.zeros([3, basis_length, basis_length])
+        for x in range(3):
+            for i in range(basis_length):
+                d_base_i = self.basis.derivative(i, x)
+                for j, base_j in enumerate(self.basis):
+                    dV_nuc[x, i, j] = self.integrator.integrate(self._integrand(d_base_i, base_j))
+        self._potential_samples = None
+        self._potential_values = None
+        return dV_nuc
+
+    def _calculate_operator_derivative(self) -> np.ndarray:
+        """
+        Calculation of matrix elements of the derivative of nuclear potential operator
+        :return: ndarray where array.shape = (number of nuclei, 3, len(basis), len(basis))
+        """
+        basis_length = len(self.basis)
+        dV_operator = np.zeros([len(self.molecule.atomic_numbers), 3, basis_length, basis_length])
+        for a in range(len(self.molecule.atomic_numbers)):
+            for x in range(3):
+                force = self.cached_coulomb_force(self.nuclear_coulomb_force(a, x))
+                for i, base_i in enumerate(self.basis):
+                    for j in range(i, basis_length):
+                        base_j = self.basis[j]
+                        v_ij = self.integrator.integrate(lambda r: base_i(r) * force(r) * base_j(r))
+                        dV_operator[a, x, i, j] = v_ij
+                        dV_operator[a, x, j, i] = v_ij
+        return dV_operator
@@ -0,0 +1,83 @@
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
+from SCF_method.calculation.gradients.kinetic_energy_derivative_matrix import KineticEnergyDerivative
+from SCF_method.calculation.gradients.nuclear_attraction_derivative_matrix import NuclearAttractionDerivative
+from SCF_method.calculation.gradients.overlap_derivative_matrix import OverlapDerivative
+from SCF_method.calculation.gradients.two_electron_integral_derivative_matrix import TwoElectronIntegralDerivative
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.logger import SCF_logger
+
+
+class HartreeFockGradient:
+    """
+    Analytic gradient of Hartree-Fock energy with respect to nuclei positions
+    Gradient is calculated from converged SCF state, derivative integrals and energy weighted density matrix:
+    dE/dRa = SUM P*dH + 1/2 SUM P*P*d(mnls) - SUM W*dS + dV_nn
+    This procedure is described in : Attila Szabo, Neil S. Ostlund; Modern Quantum Chemistry; page 440
+    """
+    def __init__(self,
+                 SCF_obj: SelfConsistentFieldCalculation,
+                 molecule: Molecule,
+                 basis: RootBasis,
+                 integrator_3D: BaseIntegrator,
+                 integrator_6D: BaseIntegrator):
+        """
+        :param SCF_obj: SelfConsistentFieldCalculation, state of the converged SCF calculation
+        :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator_3D: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param integrator_6D: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        """
+        self.SCF_obj = SCF_obj
+        self.molecule = molecule
+        self.basis = basis
+        self.integrator_3D = integrator_3D
+        self.integrator_6D = integrator_6D
+        if not basis.is_centered_on(molecule.nuclei_positions):
+            raise ValueError("Nuclear gradient requires basis centered on nuclei of the molecule "
+                             "in the same order (basis nuclei_positions differ from molecule nuclei_positions)")
+        SCF_logger.info("Calculating nuclear gradient")
+        self.gradient = self._calculate_self()
+
+    @staticmethod
+    def two_electron_density(P: np.ndarray) -> np.ndarray:
+        """
+        Two particle density which multiplies mnls in the electronic energy:
+        E_2 = 1/2 SUM Gamma[m, n, l, s] * mnls[m, n, l, s]
+        Gamma is symmetrized in the same way as mnls, so that every element of mnls related by permutational
+        symmetry carries the same weight
+        :param P: ndarray, electron density matrix
+        :return: ndarray where array.shape = (len(basis), len(basis), len(basis), len(basis))
+        """
+        gamma = np.einsum('mn,ls->mnls', P, P) - 0.5 * np.einsum('ms,nl->mnls', P, P)
+        gamma = (gamma + gamma.transpose(1, 0, 2, 3)) / 2
+        gamma = (gamma + gamma.transpose(0, 1, 3, 2)) / 2
+        gamma = (gamma + gamma.transpose(2, 3, 0, 1)) / 2
+        return gamma
+
+    def _calculate_self(self) -> np.ndarray:
+        """
+        Calculation of the nuclear gradient itself
+        One electron derivative matrices carry derivative of the first basis function only, contributions
+        are summed up to the nuclei on which the basis functions are centered
+        Two electron contribution is contracted with two electron density during integration
+        :return: ndarray where array.shape = (number of nuclei, 3)
+        """
+        P = self.SCF_obj.P
+        W = self.SCF_obj.calculate_energy_weighted_density_matrix()
+        dS = OverlapDerivative(self.basis, self.integrator_3D)
+        dT = KineticEnergyDerivative(self.basis, self.integrator_3D)
+        dV_nuc = NuclearAttractionDerivative(self.molecule, self.basis, self.integrator_3D)
+        dmnls = TwoElectronIntegralDerivative(self.basis, self.integrator_6D, self.two_electron_density(P))
+
+        basis_contributions = 2 * (np.einsum('mn,xmn->xm', P, dT.matrix + dV_nuc.matrix)
+                                   - np.einsum('mn,xmn->xm', W, dS.matrix))
+
+        gradient = np.einsum('mn,axmn->ax', P, dV_nuc.operator_matrix) + dmnls.gradient
+        np.add.at(gradient, self.basis.center_indices(), basis_contributions.T)
+        gradient += self.molecule.nuclear_repulsion_gradient()
+        SCF_logger.info(f"Nuclear gradient: {gradient.tolist()}")
+        return gradient
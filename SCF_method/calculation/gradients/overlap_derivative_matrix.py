@@ -0,0 +1,40 @@
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.matrices.overlap_matrix import Overlap
+from SCF_method.logger import SCF_logger
+
+
+class OverlapDerivative(Overlap):
+    """
+    This class represents derivative of orbital overlap matrix S with respect to nuclei positions
+    Matrix element [x, i, j] is integral of derivative of base_i (with respect to coordinate x of its center)
+    multiplied by base_j. Derivative of the whole matrix is assembled in the gradient calculation
+    Unlike Overlap, calculation of this matrix does not mutate the basis object
+    """
+    def __init__(self,
+                 basis: RootBasis,
+                 integrator: BaseIntegrator):
+        """
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        """
+        self.basis = basis
+        self.integrator = integrator
+        SCF_logger.info("Calculating dS - orbital overlap derivative matrix")
+        self.matrix = self._calculate_self()
+
+    def _calculate_self(self) -> np.ndarray:
+        """
+        Calculation of orbital overlap derivative matrix itself
+        :return: ndarray where array.shape = (3, len(basis), len(basis))
+        """
+        basis_length = len(self.basis)
+        dS = np.zeros([3, basis_length, basis_length])
+        for x in range(3):
+            for i in range(basis_length):
+                d_base_i = self.basis.derivative(i, x)
+                for j, base_j in enumerate(self.basis):
+                    dS[x, i, j] = self.integrator.integrate(self._integrand(d_base_i, base_j))
+        return dS
@@ -0,0 +1,104 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.matrices.two_electron_integral_matrix import TwoElectronIntegral
+from SCF_method.logger import SCF_logger
+
+
+class TwoElectronIntegralDerivative(TwoElectronIntegral):
+    """
+    This class represents contribution of two electron interaction matrix mnls to the nuclear gradient
+    Derivative is integrated only for canonical quartets i <= j, k <= l, ij <= kl, the same elements which are
+    integrated in TwoElectronIntegral, and all four basis functions of the quartet are differentiated,
+    therefore the result is derivative of the numerical estimate of mnls which enters the energy
+    Derivatives are contracted with two electron density immediately, so no derivative matrix is stored
+    """
+    def __init__(self,
+                 basis: RootBasis,
+                 integrator: BaseIntegrator,
+                 two_electron_density: np.ndarray):
+        """
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param two_electron_density: ndarray, symmetrized two particle density, array.shape = (len(basis),)*4
+        """
+        self.basis = basis
+        self.integrator = integrator
+        self.two_electron_density = two_electron_density
+        self._potential_samples = None
+        self._potential_values = None
+        SCF_logger.info("Calculating dmnls - two electron integral contribution to nuclear gradient")
+        self.gradient = self._calculate_self()
+
+    def cached_electron_potential(self, r: np.ndarray):
+        """
+        Electron Coulombic potential which is evaluated only once for given block of samples
+        Potential does not depend on the quartet, therefore it is reused for all derivative integrals
+        as long as integrator passes the same samples array
+        :param r: ndarray, r.shape = (N,6)
+        :return: ndarray, potential.shape = (N,)
+        """
+        if r is not self._potential_samples:
+            self._potential_samples = r
+            self._potential_values = self.electron_coulomb_potential(r)
+        return self._potential_values
+
+    def _derivative_integrand(self, quartet: Tuple, nucleus: int, axis: int) -> Callable:
+        """
+        Returns derivative of the integrand of mnls[i, j, k, l] with respect to coordinate of the nucleus:
+        sum of the terms where base function centered on the nucleus is replaced by its derivative
+        :param quartet: tuple of indices (i, j, k, l) of basis functions
+        :param nucleus: int, index of nucleus on which at least one of the basis functions is centered
+        :param axis: int, coordinate of the nucleus (0, 1, 2 for x, y, z)
+        :return: function to integrate
+        """
+        V_electron = self.cached_electron_potential
+        centers = self.basis.center_indices()
+        bases = [self.basis[index] for index in quartet]
+        d_bases = [self.basis.derivative(index, axis) if centers[index] == nucleus else None for index in quartet]
+
+        def electron_potential_derivative(r: np.ndarray):
+            """
+            :param r: ndarray, r.shape(N,6) because it covers coordinates for both electrons in calculation
+            :return: function
+            """
+            coordinates = (r[:, :3], r[:, :3], r[:, 3:], r[:, 3:])
+            values = [base(r_electron) for base, r_electron in zip(bases, coordinates)]
+            derivative = np.zeros(r.shape[0])
+            for position, d_base in enumerate(d_bases):
+                if d_base is not None:
+                    term = d_base(coordinates[position])
+                    for other, value in enumerate(values):
+                        if other != position:
+                            term = term * value
+                    derivative += term
+            return derivative * V_electron(r)
+
+        return electron_potential_derivative
+
+    def _calculate_self(self) -> np.ndarray:
+        """
+        Calculation of the contribution 1/2 SUM Gamma*d(mnls) to the nuclear gradient itself
+        Every canonical quartet stands for all (up to 8) elements of mnls related by permutational symmetry
+        :return: ndarray where array.shape = (number of nuclei, 3)
+        """
+        basis_length = len(self.basis)
+        centers = self.basis.center_indices()
+        gradient = np.zeros([len(self.basis.nuclei_positions), 3])
+        for i in range(basis_length):
+            for j in range(i, basis_length):
+                for k in range(i, basis_length):
+                    for l in range(j if k == i else k, basis_length):
+                        elements = {(i, j, k, l), (j, i, k, l), (i, j, l, k), (j, i, l, k),
+                                    (k, l, i, j), (l, k, i, j), (k, l, j, i), (l, k, j, i)}
+                        weight = 0.5 * len(elements) * self.two_electron_density[i, j, k, l]
+                        for nucleus in np.unique(centers[[i, j, k, l]]):
+                            for x in range(3):
+                                gradient[nucleus, x] += weight * self.integrator.integrate(
+                                    self._derivative_integrand((i, j, k, l), nucleus, x))
+        self._potential_samples = None
+        self._potential_values = None
+        return gradient
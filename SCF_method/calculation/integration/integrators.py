@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Callable
+from typing import Dict, List, Callable
 
 import numpy as np
 
+from SCF_method.calculation.integration.sample_pool import SamplePool
+
 
 class BaseIntegrator(ABC):
     """
@@ -19,6 +21,15 @@ class BaseIntegrator(ABC):
         """
         pass
 
+    @abstractmethod
+    def parameters(self) -> Dict:
+        """
+        Parameters which determine results of the integration,
+        used for identification of precalculated integrals
+        :return: Dict
+        """
+        pass
+
 
 class MonteCarloIntegrator(BaseIntegrator):
     """
@@ -30,18 +41,48 @@ class MonteCarloIntegrator(BaseIntegrator):
     def __init__(self,
                  n_samples: int,
                  boundaries: List,
-                 dimensions: int):
+                 dimensions: int,
+                 seed: int = None,
+                 sample_pool: SamplePool = None):
         """
 
         :param n_samples: number of samples used for calculating average value
         :param boundaries: range of the integration in domain of multidimensional cube
         :param dimensions: dimension of the domain
+        :param seed: int, seed of the random generator for reproducible results
+        :param sample_pool: SamplePool, shared pool of samples, if given no new samples are drawn,
+                            n_samples, boundaries and seed have to agree with the pool
         """
         self.n_samples = n_samples
         self.upper_bound = boundaries[1]
         self.lower_bound = boundaries[0]
         self.dimensions = dimensions
-        self.samples = np.random.uniform(boundaries[1], boundaries[0], size=(n_samples, dimensions))
+        self.seed = sample_pool.seed if sample_pool is not None else seed
+        if sample_pool is not None:
+            self._check_sample_pool(sample_pool, seed)
+            self.samples = sample_pool.view(dimensions)
+        else:
+            self.samples = np.random.default_rng(seed).uniform(boundaries[0], boundaries[1],
+                                                               size=(n_samples, dimensions))
+
+    def _check_sample_pool(self, sample_pool: SamplePool, seed: int = None):
+        """
+        Domain volume used in integration and parameters used for identification of precalculated integrals
+        are taken from the integrator, therefore they have to describe the samples of the pool
+        :param sample_pool: SamplePool, shared pool of samples
+        :param seed: int, seed given to the integrator
+        :return: None
+        """
+        differences = []
+        if self.n_samples != sample_pool.n_samples:
+            differences.append(f"n_samples: pool {sample_pool.n_samples}, integrator {self.n_samples}")
+        if [self.lower_bound, self.upper_bound] != [sample_pool.lower_bound, sample_pool.upper_bound]:
+            differences.append(f"boundaries: pool {[sample_pool.lower_bound, sample_pool.upper_bound]}, "
+                               f"integrator {[self.lower_bound, self.upper_bound]}")
+        if seed is not None and seed != sample_pool.seed:
+            differences.append(f"seed: pool {sample_pool.seed}, integrator {seed}")
+        if differences:
+            raise ValueError("Integrator does not match its sample pool (" + "; ".join(differences) + ")")
 
     def integrate(self, func: Callable) -> float:
         """
@@ -53,3 +94,15 @@ class MonteCarloIntegrator(BaseIntegrator):
         domain = (self.upper_bound - self.lower_bound)**self.dimensions
         integration_output = np.mean(func(self.samples))*domain
         return integration_output
+
+    def parameters(self) -> Dict:
+        """
+        :return: Dict of number of samples, boundaries, dimension and seed
+        """
+        return {
+            "type": "MC",
+            "n_samples": self.n_samples,
+            "boundaries": [self.lower_bound, self.upper_bound],
+            "dimensions": self.dimensions,
+            "seed": self.seed
+        }
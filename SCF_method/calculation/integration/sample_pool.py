@@ -0,0 +1,142 @@
+import json
+import os
+import tempfile
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from SCF_method.logger import SCF_logger
+
+
+class SamplePool:
+    """
+    Pool of uniformly distributed samples shared by Monte Carlo integrators
+    Samples are drawn once for the highest dimension needed and lower dimensional integrators
+    use a view of the first columns, e.g. 3D integrator uses r1 coordinates of the 6D pool
+    Pool may be persisted in .npy file and memory mapped in the next runs
+    Parameters of the pool are stored in .json file next to it and checked when the pool is reused
+    """
+
+    chunk_size = 1000000
+    # number of samples generated at once when the pool is written to file
+
+    def __init__(self,
+                 n_samples: int,
+                 boundaries: List,
+                 dimensions: int,
+                 seed: int = None,
+                 path: str = None):
+        """
+        :param n_samples: number of samples in the pool
+        :param boundaries: range of the integration in domain of multidimensional cube
+        :param dimensions: dimension of the domain, the highest dimension of integrators using the pool
+        :param seed: int, seed of the random generator for reproducible results
+        :param path: str, path to .npy file where the pool is persisted, existing file is memory mapped
+                     instead of drawing new samples
+        """
+        self.n_samples = n_samples
+        self.lower_bound = boundaries[0]
+        self.upper_bound = boundaries[1]
+        self.dimensions = dimensions
+        self.seed = seed
+        self.path = path
+        self.samples = self._create_samples()
+
+    def _metadata(self) -> Dict:
+        return {
+            "n_samples": self.n_samples,
+            "dimensions": self.dimensions,
+            "boundaries": [self.lower_bound, self.upper_bound],
+            "seed": self.seed
+        }
+
+    @staticmethod
+    def metadata_path(path: str) -> str:
+        """
+        :param path: str, path to .npy file of the pool
+        :return: str, path to .json file with parameters of the pool
+        """
+        return os.path.splitext(path)[0] + ".json"
+
+    def _check_metadata(self):
+        """
+        Persisted pool can be reused only if it was drawn with the same parameters
+        :return: None
+        """
+        metadata_path = self.metadata_path(self.path)
+        if not os.path.exists(metadata_path):
+            raise ValueError(f"Sample pool in {self.path} has no parameters file {metadata_path}")
+        with open(metadata_path) as metadata_file:
+            metadata = json.load(metadata_file)
+        differences = [f"{key}: stored {metadata.get(key)}, expected {value}"
+                       for key, value in self._metadata().items() if metadata.get(key) != value]
+        if differences:
+            raise ValueError(f"Sample pool in {self.path} was drawn with different parameters ("
+                             + "; ".join(differences) + ")")
+
+    @staticmethod
+    def _write_atomically(write: Callable, path: str):
+        """
+        File is written to temporary file in the same directory and then renamed,
+        so that concurrent processes never see partially written file
+        :param write: function writing to the given path
+        :param path: str, final path of the file
+        :return: None
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1], dir=directory)
+        os.close(descriptor)
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def _write_samples(self, path: str):
+        rng = np.random.default_rng(self.seed)
+        samples = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                            shape=(self.n_samples, self.dimensions))
+        for start in range(0, self.n_samples, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_samples)
+            samples[start:stop] = rng.uniform(self.lower_bound, self.upper_bound, size=(stop - start, self.dimensions))
+        samples.flush()
+        del samples
+
+    def _write_metadata(self, path: str):
+        with open(path, "w") as metadata_file:
+            json.dump(self._metadata(), metadata_file)
+
+    def _create_samples(self) -> np.ndarray:
+        """
+        Samples are loaded from file if it exists, drawn to the new file if path is given,
+        otherwise drawn into memory
+        :return: ndarray, array.shape = (n_samples, dimensions)
+        """
+        shape = (self.n_samples, self.dimensions)
+        if self.path is None:
+            return np.random.default_rng(self.seed).uniform(self.lower_bound, self.upper_bound, size=shape)
+
+        if not os.path.exists(self.path):
+            SCF_logger.info(f"Writing sample pool to {self.path}")
+            # parameters are written first, so that the pool file never exists without them
+            self._write_atomically(self._write_metadata, self.metadata_path(self.path))
+            self._write_atomically(self._write_samples, self.path)
+
+        SCF_logger.info(f"Memory mapping sample pool from {self.path}")
+        self._check_metadata()
+        samples = np.load(self.path, mmap_mode='r')
+        if samples.shape != shape:
+            raise ValueError(f"Sample pool in {self.path} has shape {samples.shape}, expected {shape}")
+        return samples
+
+    def view(self, dimensions: int) -> np.ndarray:
+        """
+        View of the pool for lower dimensional integrator, no samples are copied
+        :param dimensions: dimension of the domain of integrator
+        :return: ndarray, array.shape = (n_samples, dimensions)
+        """
+        if dimensions > self.dimensions:
+            raise ValueError(f"Sample pool has {self.dimensions} dimensions, {dimensions} requested")
+        return self.samples[:, :dimensions]
@@ -4,6 +4,7 @@ import numpy as np
 
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.symmetry.point_group import PointGroup, pair_orbits
 from SCF_method.logger import SCF_logger
 
 
@@ -20,14 +21,17 @@ class KineticEnergy:
 
     def __init__(self,
                  basis: RootBasis,
-                 integrator: BaseIntegrator):
+                 integrator: BaseIntegrator,
+                 symmetry: PointGroup = None):
         """
         :param basis: RootBasis (parent class), object representing basis set used for calculation
         :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param symmetry: PointGroup of the molecule, only symmetry unique elements are integrated if given
         """
 
         self.basis = basis
         self.integrator = integrator
+        self.symmetry = symmetry
         SCF_logger.info("Calculating T - kinetic energy matrix")
         self.matrix = self._calculate_self()
 
@@ -72,13 +76,12 @@ class KineticEnergy:
         """
         basis_length = len(self.basis)
         T = np.zeros([basis_length, basis_length])
-        for i, base_i in enumerate(self.basis):
-            for j in range(i, basis_length):
-                t_ij = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
-                if i == j:
-                    T[i, j] = t_ij
-                else:
-                    # TODO refactor the terms with np.conj in case when basis is not real, matrix have to be Hermitian
-                    T[i, j] = t_ij
-                    T[j, i] = t_ij
+        # TODO refactor the terms with np.conj in case when basis is not real, matrix have to be Hermitian
+        if self.symmetry is None:
+            for i, base_i in enumerate(self.basis):
+                for j in range(i, basis_length):
+                    T[i, j] = T[j, i] = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
+        else:
+            for i, j, orbit in pair_orbits(self.symmetry.basis_permutations(self.basis)):
+                T[orbit] = self.integrator.integrate(self._integrand(self.basis[i], self.basis[j]))
         return T
@@ -5,6 +5,7 @@ import numpy as np
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.integration.integrators import BaseIntegrator
 from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.calculation.symmetry.point_group import PointGroup, pair_orbits
 from SCF_method.logger import SCF_logger
 
 
@@ -17,15 +18,20 @@ class NuclearAttraction:
     def __init__(self,
                  molecule: Molecule,
                  basis: RootBasis,
-                 integrator: BaseIntegrator):
+                 integrator: BaseIntegrator,
+                 symmetry: PointGroup = None):
         """
         :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
         :param basis: RootBasis (parent class), object representing basis set used for calculation
         :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param symmetry: PointGroup of the molecule, only symmetry unique elements are integrated if given
         """
         self.molecule = molecule
         self.basis = basis
         self.integrator = integrator
+        self.symmetry = symmetry
+        self._potential_samples = None
+        self._potential_values = None
         SCF_logger.info("Calculating V_nuc - nuclear attraction matrix")
         self.matrix = self._calculate_self()
 
@@ -36,7 +42,7 @@ class NuclearAttraction:
         :param base_j: function from the self.basis
         :return: function to integrate
         """
-        V_nuclear = self.nuclear_coulomb_potential
+        V_nuclear = self.cached_coulomb_potential
 
         def nuclear_potential(r: np.ndarray):
             return base_i(r)*V_nuclear(r)*base_j(r)
@@ -48,12 +54,28 @@ class NuclearAttraction:
         """
         Calculation of the nuclear Coulombic potential from given molecule:
         potential: SUMa (- Za / abs( r - Ra ))
-        :param r:
-        :return:
+        Contributions of nuclei are accumulated in place, so only one array of len(r) is allocated
+        instead of one array per nucleus
+        :param r: ndarray, r.shape = (N,3)
+        :return: ndarray, potential.shape = (N,)
         """
-        return np.sum([-self.molecule.atomic_numbers[i] /
-                       np.sqrt(np.sum((r - self.molecule.nuclei_positions[i]) ** 2, axis=1))
-                       for i in range(len(self.molecule.atomic_numbers))], axis=0)
+        potential = np.zeros(r.shape[0])
+        for Z, R in zip(self.molecule.atomic_numbers, self.molecule.nuclei_positions):
+            potential -= Z / np.sqrt(np.sum((r - R) ** 2, axis=1))
+        return potential
+
+    def cached_coulomb_potential(self, r: np.ndarray):
+        """
+        Nuclear Coulombic potential which is evaluated only once for given block of samples
+        Potential does not depend on the matrix element, therefore it is reused for all (i, j) pairs
+        as long as integrator passes the same samples array
+        :param r: ndarray, r.shape = (N,3)
+        :return: ndarray, potential.shape = (N,)
+        """
+        if r is not self._potential_samples:
+            self._potential_samples = r
+            self._potential_values = self.nuclear_coulomb_potential(r)
+        return self._potential_values
 
     def _calculate_self(self) -> np.ndarray:
         """
@@ -62,12 +84,13 @@ class NuclearAttraction:
         """
         basis_length = len(self.basis)
         V_nuc = np.zeros([basis_length, basis_length])
-        for i, base_i in enumerate(self.basis):
-            for j in range(i, basis_length):
-                v_ij = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
-                if i == j:
-                    V_nuc[i, j] = v_ij
-                else:
-                    V_nuc[i, j] = v_ij
-                    V_nuc[j, i] = v_ij
+        if self.symmetry is None:
+            for i, base_i in enumerate(self.basis):
+                for j in range(i, basis_length):
+                    V_nuc[i, j] = V_nuc[j, i] = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
+        else:
+            for i, j, orbit in pair_orbits(self.symmetry.basis_permutations(self.basis)):
+                V_nuc[orbit] = self.integrator.integrate(self._integrand(self.basis[i], self.basis[j]))
+        self._potential_samples = None
+        self._potential_values = None
         return V_nuc
@@ -4,6 +4,7 @@ import numpy as np
 
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.symmetry.point_group import PointGroup, pair_orbits
 from SCF_method.logger import SCF_logger
 
 
@@ -15,13 +16,16 @@ class Overlap:
     """
     def __init__(self,
                  basis: RootBasis,
-                 integrator: BaseIntegrator):
+                 integrator: BaseIntegrator,
+                 symmetry: PointGroup = None):
         """
         :param basis: RootBasis (parent class), object representing basis set used for calculation
         :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param symmetry: PointGroup of the molecule, only symmetry unique elements are integrated if given
         """
         self.basis = basis
         self.integrator = integrator
+        self.symmetry = symmetry
         SCF_logger.info("Calculating S - orbital overlap matrix")
         self.matrix = self._calculate_self()
 
@@ -45,16 +49,15 @@ class Overlap:
         """
         basis_length = len(self.basis)
         S = np.zeros([basis_length, basis_length])
-        for i, base_i in enumerate(self.basis):
-            for j in range(i, basis_length):
-                s_ij = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
-                if i == j:
-                    S[i, j] = s_ij
-                else:
-                    S[i, j] = s_ij
-                    S[j, i] = s_ij
+        if self.symmetry is None:
+            for i, base_i in enumerate(self.basis):
+                for j in range(i, basis_length):
+                    S[i, j] = S[j, i] = self.integrator.integrate(self._integrand(base_i, self.basis[j]))
+        else:
+            for i, j, orbit in pair_orbits(self.symmetry.basis_permutations(self.basis)):
+                S[orbit] = self.integrator.integrate(self._integrand(self.basis[i], self.basis[j]))
         norm_coeffs = np.sqrt(np.diag(S))
         SCF_logger.info(f"Basis renormalization with coeffs: {norm_coeffs}")
-        self.basis.renormalize(1./norm_coeffs)
+        self.basis.renormalize(self.basis.normalization_factors.flatten()/norm_coeffs)
         S = S / np.outer(norm_coeffs, norm_coeffs)
         return S
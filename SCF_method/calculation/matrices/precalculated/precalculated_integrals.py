@@ -0,0 +1,192 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict
+
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.logger import SCF_logger
+
+
+class PrecalculatedIntegrals:
+    """
+    Provider of molecular integrals calculated in previous runs
+    Integrals are stored in a directory as .npy files and loaded lazily as read-only memory mapped arrays,
+    therefore many processes using the same directory share one page cached copy of data
+    Directory has to contain either all integrals or none of them, matrices calculated under different
+    normalization of basis cannot be combined
+    Integrals are identified by fingerprint of molecule, basis and integrators which is verified before use
+    """
+
+    file_names = {
+        "S": "S.npy",
+        "T": "T.npy",
+        "V_nuc": "V_nuc.npy",
+        "mnls": "mnls.npy",
+        "normalization_factors": "normalization_factors.npy",
+        "fingerprint": "fingerprint.json"
+    }
+
+    matrix_names = ("S", "T", "V_nuc", "mnls")
+
+    def __init__(self, path: str):
+        """
+        :param path: str, directory with precalculated integrals
+        """
+        self.path = path
+        self._matrices = {}
+
+    def _file_path(self, name: str) -> str:
+        return os.path.join(self.path, self.file_names[name])
+
+    def has(self, name: str) -> bool:
+        """
+        :param name: str, name of the stored file (S, T, V_nuc, mnls, normalization_factors, fingerprint)
+        :return: bool, whether the file is stored
+        """
+        return os.path.exists(self._file_path(name))
+
+    def get(self, name: str) -> np.ndarray:
+        """
+        Matrix is memory mapped at the first access, no data are read until they are used
+        :param name: str, name of the matrix (S, T, V_nuc, mnls, normalization_factors)
+        :return: ndarray, read-only memory mapped array
+        """
+        if name not in self._matrices:
+            SCF_logger.info(f"Memory mapping precalculated {name} from {self._file_path(name)}")
+            self._matrices[name] = np.load(self._file_path(name), mmap_mode='r')
+        return self._matrices[name]
+
+    @staticmethod
+    def fingerprint(molecule: Molecule,
+                    basis: RootBasis,
+                    integrator_3D: BaseIntegrator,
+                    integrator_6D: BaseIntegrator) -> Dict:
+        """
+        Data which determine values of molecular integrals
+        :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator_3D: BaseIntegrator (parent class), integrator object used for one electron integrals
+        :param integrator_6D: BaseIntegrator (parent class), integrator object used for two electron integrals
+        :return: Dict which can be written to json file
+        """
+        fingerprint = {
+            "nuclei_positions": np.array(molecule.nuclei_positions, dtype=float).tolist(),
+            "atomic_numbers": np.array(molecule.atomic_numbers).tolist(),
+            "basis_type": type(basis).__name__,
+            "basis_nuclei_positions": np.array(basis.nuclei_positions, dtype=float).tolist(),
+            "basis_params": {key: np.array(value).tolist() for key, value in basis.kwargs.items()},
+            "integrator_3D": integrator_3D.parameters(),
+            "integrator_6D": integrator_6D.parameters()
+        }
+        return json.loads(json.dumps(fingerprint))
+
+    def load(self,
+             molecule: Molecule,
+             basis: RootBasis,
+             integrator_3D: BaseIntegrator,
+             integrator_6D: BaseIntegrator) -> Dict:
+        """
+        Verification of stored integrals and application of stored normalization to the basis
+        :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :param integrator_3D: BaseIntegrator (parent class), integrator object used for one electron integrals
+        :param integrator_6D: BaseIntegrator (parent class), integrator object used for two electron integrals
+        :return: Dict of read-only memory mapped matrices S, T, V_nuc, mnls, None if directory contains no integrals
+        """
+        stored = [name for name in self.file_names if self.has(name)]
+        if not stored:
+            SCF_logger.info(f"No precalculated integrals in {self.path}")
+            return None
+        missing = [self.file_names[name] for name in self.file_names if name not in stored]
+        if missing:
+            raise ValueError(f"Precalculated integrals in {self.path} are incomplete, missing: {', '.join(missing)}")
+
+        with open(self._file_path("fingerprint")) as fingerprint_file:
+            stored_fingerprint = json.load(fingerprint_file)
+        fingerprint = self.fingerprint(molecule, basis, integrator_3D, integrator_6D)
+        differences = [key for key in sorted(set(fingerprint) | set(stored_fingerprint))
+                       if fingerprint.get(key) != stored_fingerprint.get(key)]
+        if differences:
+            raise ValueError(f"Precalculated integrals in {self.path} were calculated for different "
+                             f"{', '.join(differences)}")
+
+        matrices = {name: self.get(name) for name in self.matrix_names}
+        for name, matrix in matrices.items():
+            if any(dimension != len(basis) for dimension in matrix.shape):
+                raise ValueError(f"Precalculated {name} has shape {matrix.shape}, basis has {len(basis)} elements")
+        self.apply_normalization(basis)
+        SCF_logger.info(f"Using precalculated integrals from {self.path}")
+        return matrices
+
+    def apply_normalization(self, basis: RootBasis):
+        """
+        Precalculated overlap matrix corresponds to the normalized basis,
+        normalization factors from the previous run have to be applied to the basis
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :return: None
+        """
+        normalization_factors = np.array(self.get("normalization_factors"))
+        if normalization_factors.size != len(basis):
+            raise ValueError(f"Precalculated normalization factors have {normalization_factors.size} elements, "
+                             f"basis has {len(basis)}")
+        basis.renormalize(normalization_factors.flatten())
+
+    @staticmethod
+    def _replace_directory(source: str, path: str):
+        """
+        Directory path is replaced by the source directory, existing directory is renamed first
+        and removed afterwards, processes which already mapped its files keep reading them
+        :param source: str, completely written directory
+        :param path: str, final path of the directory
+        :return: None
+        """
+        old_path = source + ".old"
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(source, path)
+        if os.path.exists(old_path):
+            shutil.rmtree(old_path, ignore_errors=True)
+
+    @classmethod
+    def save(cls, path: str, SCF_obj: SelfConsistentFieldCalculation, basis: RootBasis, fingerprint: Dict):
+        """
+        Stores molecular integrals of the calculation, so that they can be reused in next runs
+        Files are written to temporary directory next to path which then replaces the directory,
+        so that concurrent processes never map partially written files or files of two different sets
+        :param path: str, directory for precalculated integrals
+        :param SCF_obj: SelfConsistentFieldCalculation, state of the SCF calculation
+        :param basis: RootBasis (parent class), normalized basis used for calculation
+        :param fingerprint: Dict, fingerprint of the calculation created by PrecalculatedIntegrals.fingerprint
+        :return: None
+        """
+        path = os.path.abspath(path)
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        matrices = {
+            "S": SCF_obj.S,
+            "T": SCF_obj.T,
+            "V_nuc": SCF_obj.V_nuc,
+            "mnls": SCF_obj.mnls,
+            "normalization_factors": basis.normalization_factors
+        }
+        temporary_path = tempfile.mkdtemp(prefix=os.path.basename(path) + ".", dir=parent)
+        try:
+            # mkdtemp creates directory accessible only to the owner, usual permissions are restored
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temporary_path, 0o777 & ~umask)
+            for name, matrix in matrices.items():
+                np.save(os.path.join(temporary_path, cls.file_names[name]), matrix)
+            with open(os.path.join(temporary_path, cls.file_names["fingerprint"]), "w") as fingerprint_file:
+                json.dump(fingerprint, fingerprint_file, indent=4)
+            cls._replace_directory(temporary_path, path)
+        except BaseException:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+            raise
+        SCF_logger.info(f"Precalculated integrals saved to {path}")
@@ -4,6 +4,7 @@ import numpy as np
 
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.symmetry.point_group import PointGroup, quartet_orbits
 from SCF_method.logger import SCF_logger
 
 
@@ -16,13 +17,16 @@ class TwoElectronIntegral:
     """
     def __init__(self,
                  basis: RootBasis,
-                 integrator: BaseIntegrator):
+                 integrator: BaseIntegrator,
+                 symmetry: PointGroup = None):
         """
         :param basis: RootBasis (parent class), object representing basis set used for calculation
         :param integrator: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param symmetry: PointGroup of the molecule, only symmetry unique elements are integrated if given
         """
         self.basis = basis
         self.integrator = integrator
+        self.symmetry = symmetry
         SCF_logger.info("Calculating mnls - two electron integral matrix")
         self.matrix = self._calculate_self()
 
@@ -53,24 +57,43 @@ class TwoElectronIntegral:
     def _calculate_self(self) ->np.ndarray:
         """
         Calculation of two electron interaction matrix itself
+        Only canonical quartets i <= j, k <= l, ij <= kl are integrated and copied to the elements
+        related by 8-fold permutational symmetry of mnls
+        If symmetry of the molecule is given, only one quartet of each orbit under its operations is integrated
         :return: ndarray where array.shape = (len(basis), len(basis), len(basis), len(basis))
         """
+        if self.symmetry is not None:
+            return self._calculate_symmetry_unique()
         basis_length = len(self.basis)
         mnls = np.zeros([basis_length, basis_length, basis_length, basis_length])
-        for i, base_i in enumerate(self.basis):
-            for j, base_j in enumerate(self.basis):
-                for k, base_k in enumerate(self.basis):
-                    for l, base_l in enumerate(self.basis):
-                        if not mnls[i, j, k, l]:
-                            mnls[i, j, k, l] = self.integrator.integrate(self._integrand(base_i,
-                                                                                         base_j,
-                                                                                         base_k,
-                                                                                         base_l))
-                            mnls[j, i, k, l] = mnls[i, j, k, l]
-                            mnls[i, j, l, k] = mnls[i, j, k, l]
-                            mnls[j, i, l, k] = mnls[i, j, k, l]
-                            mnls[k, l, i, j] = mnls[i, j, k, l]
-                            mnls[l, k, i, j] = mnls[i, j, k, l]
-                            mnls[k, l, j, i] = mnls[i, j, k, l]
-                            mnls[l, k, j, i] = mnls[i, j, k, l]
+        for i in range(basis_length):
+            for j in range(i, basis_length):
+                for k in range(i, basis_length):
+                    for l in range(j if k == i else k, basis_length):
+                        mnls_ijkl = self.integrator.integrate(self._integrand(self.basis[i],
+                                                                              self.basis[j],
+                                                                              self.basis[k],
+                                                                              self.basis[l]))
+                        mnls[i, j, k, l] = mnls_ijkl
+                        mnls[j, i, k, l] = mnls_ijkl
+                        mnls[i, j, l, k] = mnls_ijkl
+                        mnls[j, i, l, k] = mnls_ijkl
+                        mnls[k, l, i, j] = mnls_ijkl
+                        mnls[l, k, i, j] = mnls_ijkl
+                        mnls[k, l, j, i] = mnls_ijkl
+                        mnls[l, k, j, i] = mnls_ijkl
+        return mnls
+
+    def _calculate_symmetry_unique(self) -> np.ndarray:
+        """
+        Calculation of two electron interaction matrix using symmetry operations of the molecule
+        :return: ndarray where array.shape = (len(basis), len(basis), len(basis), len(basis))
+        """
+        basis_length = len(self.basis)
+        mnls = np.zeros([basis_length, basis_length, basis_length, basis_length])
+        for i, j, k, l, orbit in quartet_orbits(self.symmetry.basis_permutations(self.basis)):
+            mnls[orbit] = self.integrator.integrate(self._integrand(self.basis[i],
+                                                                    self.basis[j],
+                                                                    self.basis[k],
+                                                                    self.basis[l]))
         return mnls
@@ -18,3 +18,29 @@ class Molecule:
         self.nuclei_positions = np.array(nuclei_positions)
         self.atomic_numbers = np.array(atomic_numbers)
         self.number_of_electrons = number_of_electrons
+
+    def nuclear_repulsion_energy(self) -> float:
+        """
+        Coulombic repulsion energy of nuclei: SUMa<b ( Za*Zb / abs( Ra - Rb ) )
+        :return: float
+        """
+        energy = 0.
+        for a in range(len(self.atomic_numbers)):
+            for b in range(a + 1, len(self.atomic_numbers)):
+                R_ab = self.nuclei_positions[a] - self.nuclei_positions[b]
+                energy += self.atomic_numbers[a]*self.atomic_numbers[b]/np.sqrt(np.sum(R_ab**2))
+        return energy
+
+    def nuclear_repulsion_gradient(self) -> np.ndarray:
+        """
+        Derivative of nuclear repulsion energy with respect to nuclei positions:
+        dE/dRa = SUMb ( - Za*Zb * (Ra - Rb) / abs( Ra - Rb )**3 )
+        :return: ndarray, array.shape = (number of nuclei, 3)
+        """
+        gradient = np.zeros(self.nuclei_positions.shape)
+        for a in range(len(self.atomic_numbers)):
+            for b in range(len(self.atomic_numbers)):
+                if a != b:
+                    R_ab = self.nuclei_positions[a] - self.nuclei_positions[b]
+                    gradient[a] -= self.atomic_numbers[a]*self.atomic_numbers[b]*R_ab/np.sqrt(np.sum(R_ab**2))**3
+        return gradient
@@ -0,0 +1,124 @@
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
+from SCF_method.calculation.convergence.convergence_config import ConvergenceConfig
+from SCF_method.calculation.gradients.nuclear_gradient import HartreeFockGradient
+from SCF_method.calculation.integration.integrators import BaseIntegrator
+from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.calculation.optimization.optimization_config import OptimizationConfig
+from SCF_method.calculation.procedure import SelfConsistentFieldProcedure
+from SCF_method.logger import SCF_logger
+
+
+class GeometryOptimizer:
+    """
+    Object responsible for optimization of molecular geometry by quasi-Newton BFGS method
+    In each step one SCF procedure and one analytic nuclear gradient is calculated
+    SCF procedure is started from the electron density matrix of the previous step and the basis
+    keeps its normalization from the previous step
+    OPTIMIZATION MUTATES THE MOLECULE AND THE BASIS OBJECT BY MOVING THE NUCLEI
+    """
+
+    def __init__(self,
+                 input_basis: RootBasis,
+                 input_molecule: Molecule,
+                 integrator_3D: BaseIntegrator,
+                 integrator_6D: BaseIntegrator,
+                 convergence_config: ConvergenceConfig,
+                 optimization_config: OptimizationConfig,
+                 use_symmetry: bool = False):
+        """
+        :param input_basis: RootBasis (parent class), object representing basis set used for calculation
+        :param input_molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param integrator_3D: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param integrator_6D: BaseIntegrator (parent class), integrator object with predefined values of for integration
+        :param convergence_config: ConvergenceConfig, convergence consideration of SCF procedure
+        :param optimization_config: OptimizationConfig, convergence consideration of geometry optimization
+        :param use_symmetry: bool, whether point group symmetry of the molecule is used in each SCF procedure
+        """
+        self.input_basis = input_basis
+        self.input_molecule = input_molecule
+        self.integrator_3D = integrator_3D
+        self.integrator_6D = integrator_6D
+        self.convergence_config = convergence_config
+        self.optimization_config = optimization_config
+        self.use_symmetry = use_symmetry
+        if not input_basis.is_centered_on(input_molecule.nuclei_positions):
+            raise ValueError("Geometry optimization requires basis centered on nuclei of the molecule "
+                             "in the same order (basis nuclei_positions differ from molecule nuclei_positions)")
+        self.positions = []
+        self.energies = []
+        self.gradients = []
+
+    def _move_nuclei(self, nuclei_positions: np.ndarray):
+        """
+        Moves nuclei of the molecule together with centers of basis functions
+        :param nuclei_positions: ndarray of new coordinates for system of nuclei
+        :return: None
+        """
+        self.input_molecule.nuclei_positions = nuclei_positions
+        self.input_basis.move_nuclei(nuclei_positions)
+
+    def _step(self, P: np.ndarray = None) -> SelfConsistentFieldCalculation:
+        """
+        One SCF procedure and nuclear gradient calculation for current geometry
+        :param P: ndarray, initial guess of electron density matrix
+        :return: SelfConsistentFieldCalculation, state of the converged SCF calculation
+        """
+        SCF_procedure = SelfConsistentFieldProcedure(input_basis=self.input_basis,
+                                                     input_molecule=self.input_molecule,
+                                                     integrator_3D=self.integrator_3D,
+                                                     integrator_6D=self.integrator_6D,
+                                                     convergence_config=self.convergence_config,
+                                                     use_symmetry=self.use_symmetry)
+        SCF_obj = SCF_procedure.calculate(P=P)
+        gradient = HartreeFockGradient(SCF_obj,
+                                       self.input_molecule,
+                                       self.input_basis,
+                                       self.integrator_3D,
+                                       self.integrator_6D)
+        energy = SCF_obj.electronic_energy() + self.input_molecule.nuclear_repulsion_energy()
+        SCF_logger.info(f"Total energy is {energy}")
+        self.positions.append(self.input_molecule.nuclei_positions.copy())
+        self.energies.append(energy)
+        self.gradients.append(gradient.gradient)
+        return SCF_obj
+
+    def optimize(self) -> SelfConsistentFieldCalculation:
+        """
+        BFGS update of inverse hessian according to the literature:
+        Jorge Nocedal, Stephen J. Wright; Numerical Optimization; page 140
+        Step length is limited by optimization_config.max_step instead of line search,
+        so that only one SCF procedure is needed in each step
+        :return: SelfConsistentFieldCalculation, state of the SCF calculation at the final geometry
+        """
+        SCF_logger.info("Running geometry optimization step 0")
+        SCF_obj = self._step()
+        x = self.input_molecule.nuclei_positions.astype(float).flatten()
+        g = self.gradients[-1].flatten()
+        H_inv = np.identity(x.shape[0])
+        for iteration in range(1, self.optimization_config.max_iteration + 1):
+            if np.max(np.abs(g)) <= self.optimization_config.gradient_tolerance:
+                SCF_logger.info(f"Geometry optimization converged in {iteration - 1} steps")
+                return SCF_obj
+            step = -H_inv @ g
+            step_length = np.sqrt(np.sum(step ** 2))
+            if step_length > self.optimization_config.max_step:
+                step *= self.optimization_config.max_step / step_length
+            x_new = x + step
+            self._move_nuclei(x_new.reshape(self.input_molecule.nuclei_positions.shape))
+            SCF_logger.info(f"Running geometry optimization step {iteration}")
+            SCF_obj = self._step(P=SCF_obj.P)
+            g_new = self.gradients[-1].flatten()
+            y = g_new - g
+            sy = step @ y
+            if sy > 0:
+                rho = 1. / sy
+                I = np.identity(x.shape[0])
+                H_inv = (I - rho * np.outer(step, y)) @ H_inv @ (I - rho * np.outer(y, step)) \
+                    + rho * np.outer(step, step)
+            x, g = x_new, g_new
+        SCF_logger.info(f"Geometry optimization reached {self.optimization_config.max_iteration} steps: "
+                        f"Optimization stopped")
+        return SCF_obj
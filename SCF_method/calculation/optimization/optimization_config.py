@@ -0,0 +1,19 @@
+class OptimizationConfig:
+    """
+    Optimization config object is used in the geometry optimization process
+    to cope with the iteration itself
+    """
+
+    def __init__(self,
+                 max_iteration: int = 50,
+                 gradient_tolerance: float = 1e-3,
+                 max_step: float = 0.2):
+        """
+        :param max_iteration: int, maximum number of geometry steps where the optimization should stop
+        :param gradient_tolerance: float, maximum absolute value of gradient component to consider
+                                   whether the geometry has converged
+        :param max_step: float, maximum length of one geometry step in atomic units
+        """
+        self.max_iteration = max_iteration
+        self.gradient_tolerance = gradient_tolerance
+        self.max_step = max_step
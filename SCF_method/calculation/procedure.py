@@ -1,3 +1,5 @@
+import numpy as np
+
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
 from SCF_method.calculation.convergence.convergence_config import ConvergenceConfig
@@ -5,8 +7,10 @@ from SCF_method.calculation.integration.integrators import BaseIntegrator
 from SCF_method.calculation.matrices.kinetic_energy_matrix import KineticEnergy
 from SCF_method.calculation.matrices.nuclear_attraction_matrix import NuclearAttraction
 from SCF_method.calculation.matrices.overlap_matrix import Overlap
+from SCF_method.calculation.matrices.precalculated.precalculated_integrals import PrecalculatedIntegrals
 from SCF_method.calculation.matrices.two_electron_integral_matrix import TwoElectronIntegral
 from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.calculation.symmetry.point_group import PointGroup
 
 from SCF_method.logger import SCF_logger
 
@@ -21,36 +25,60 @@ class SelfConsistentFieldProcedure:
                  input_molecule: Molecule,
                  integrator_3D: BaseIntegrator,
                  integrator_6D :BaseIntegrator,
-                 convergence_config: ConvergenceConfig):
+                 convergence_config: ConvergenceConfig,
+                 precalculated_integrals: PrecalculatedIntegrals = None,
+                 use_symmetry: bool = False):
         """
         :param basis: RootBasis (parent class), object representing basis set used for calculation
         :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
         :param integrator_3D: BaseIntegrator (parent class), integrator object with predefined values of for integration
         :param integrator_6D: BaseIntegrator (parent class), integrator object with predefined values of for integration
         :param convergence_config: ConvergenceConfig, convergence consideration
+        :param precalculated_integrals: PrecalculatedIntegrals, provider of integrals which are not calculated
+        :param use_symmetry: bool, whether symmetry equivalent integrals should be skipped
         """
         self.input_basis = input_basis
         self.input_molecule = input_molecule
         self.integrator_3D = integrator_3D
         self.integrator_6D = integrator_6D
         self.convergence_config = convergence_config
+        self.precalculated_integrals = precalculated_integrals
+        self.use_symmetry = use_symmetry
+
+    def _precalculated(self):
+        """
+        :return: Dict of precalculated matrices S, T, V_nuc, mnls or None if they have to be calculated
+        """
+        if self.precalculated_integrals is None:
+            return None
+        return self.precalculated_integrals.load(self.input_molecule,
+                                                 self.input_basis,
+                                                 self.integrator_3D,
+                                                 self.integrator_6D)
 
-    def calculate(self) -> SelfConsistentFieldCalculation:
+    def calculate(self, P: np.ndarray = None) -> SelfConsistentFieldCalculation:
         """
         Calculation of molecular integrals and iterative matrix SCF procedure
+        :param P: ndarray, initial guess of electron density matrix (e.g. from previous calculation)
         :return: SelfConsistentFieldCalculation, state of the converged SCF calculation
         """
-        S = Overlap(self.input_basis, self.integrator_3D)
-        T = KineticEnergy(self.input_basis, self.integrator_3D)
-        V_nuc = NuclearAttraction(self.input_molecule, self.input_basis, self.integrator_3D)
-        mnls = TwoElectronIntegral(self.input_basis, self.integrator_6D)
+        precalculated = self._precalculated()
+        if precalculated is not None:
+            S, T, V_nuc, mnls = (precalculated[name] for name in ("S", "T", "V_nuc", "mnls"))
+        else:
+            symmetry = PointGroup(self.input_molecule) if self.use_symmetry else None
+            S = Overlap(self.input_basis, self.integrator_3D, symmetry).matrix
+            T = KineticEnergy(self.input_basis, self.integrator_3D, symmetry).matrix
+            V_nuc = NuclearAttraction(self.input_molecule, self.input_basis, self.integrator_3D, symmetry).matrix
+            mnls = TwoElectronIntegral(self.input_basis, self.integrator_6D, symmetry).matrix
         SCF_calc = SelfConsistentFieldCalculation(
             N=self.input_molecule.number_of_electrons,
-            S=S.matrix,
-            T=T.matrix,
-            V_nuc=V_nuc.matrix,
-            mnls=mnls.matrix,
-            convergence_config=self.convergence_config
+            S=S,
+            T=T,
+            V_nuc=V_nuc,
+            mnls=mnls,
+            convergence_config=self.convergence_config,
+            P=P
         )
         SCF_iter = iter(SCF_calc)
         SCF_logger.info("Running iterative SCF procedure")
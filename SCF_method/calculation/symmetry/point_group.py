@@ -0,0 +1,261 @@
+import itertools
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from SCF_method.calculation.basis.basis_functions import RootBasis
+from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.logger import SCF_logger
+
+
+class PointGroup:
+    """
+    Point group of the molecule detected from positions and atomic numbers of nuclei
+    Symmetry operations are found among rotations, reflections, improper rotations and inversion
+    about candidate axes (principal axes, directions of nuclei, midpoints and normals of pairs of nuclei)
+    Every symmetry operation permutes nuclei and therefore also basis functions centered on them,
+    these permutations are used to skip calculation of symmetry equivalent integrals
+    """
+
+    def __init__(self,
+                 molecule: Molecule,
+                 tolerance: float = 1e-3,
+                 max_order: int = 6):
+        """
+        :param molecule: Molecule: object which defines the distribution of nuclei in space and their atomic numbers
+        :param tolerance: float, maximum distance of nuclei to consider them as symmetry equivalent
+        :param max_order: int, maximum order of rotation axis which is tested
+        """
+        self.molecule = molecule
+        self.tolerance = tolerance
+        self.max_order = max_order
+        center = np.sum(molecule.atomic_numbers[:, None] * molecule.nuclei_positions, axis=0) \
+            / np.sum(molecule.atomic_numbers)
+        self.coordinates = molecule.nuclei_positions - center
+        self.elements = self._find_elements()
+        self.atom_permutations = self._close_permutations([permutation for _, _, _, permutation in self.elements])
+        self.name = self._classify()
+        SCF_logger.info(f"Detected point group {self.name} with {len(self.atom_permutations)} "
+                        f"distinct permutations of nuclei")
+
+    @staticmethod
+    def rotation(axis: np.ndarray, angle: float) -> np.ndarray:
+        """
+        :param axis: ndarray, unit vector of rotation axis
+        :param angle: float, angle of rotation
+        :return: ndarray, rotation matrix array.shape = (3,3)
+        """
+        K = np.array([[0, -axis[2], axis[1]],
+                      [axis[2], 0, -axis[0]],
+                      [-axis[1], axis[0], 0]])
+        return np.identity(3) + np.sin(angle) * K + (1 - np.cos(angle)) * K @ K
+
+    @staticmethod
+    def reflection(normal: np.ndarray) -> np.ndarray:
+        """
+        :param normal: ndarray, unit vector normal to the mirror plane
+        :return: ndarray, reflection matrix array.shape = (3,3)
+        """
+        return np.identity(3) - 2 * np.outer(normal, normal)
+
+    def _candidate_axes(self) -> List[np.ndarray]:
+        """
+        Candidate directions of symmetry axes and normals of mirror planes
+        Centroids of triples of equivalent nuclei are needed for axes of cubic groups
+        :return: list of unit vectors unique up to the sign
+        """
+        Z = self.molecule.atomic_numbers
+        X = self.coordinates
+        inertia = np.einsum('a,a->', Z, np.sum(X ** 2, axis=1)) * np.identity(3) - np.einsum('a,ai,aj->ij', Z, X, X)
+        candidates = list(np.linalg.eigh(inertia)[1].T) + list(np.identity(3)) + list(X)
+        for a, b in itertools.combinations(range(len(X)), 2):
+            candidates.append(X[a] + X[b])
+            candidates.append(np.cross(X[a], X[b]))
+        distances = np.sqrt(np.sum(X ** 2, axis=1))
+        for a, b, c in itertools.combinations(range(len(X)), 3):
+            if Z[a] == Z[b] == Z[c] and np.ptp(distances[[a, b, c]]) < self.tolerance:
+                candidates.append(X[a] + X[b] + X[c])
+        axes = []
+        for axis in candidates:
+            norm = np.sqrt(np.sum(axis ** 2))
+            if norm < self.tolerance:
+                continue
+            axis = axis / norm
+            if not any(abs(abs(axis @ known) - 1) < self.tolerance ** 2 for known in axes):
+                axes.append(axis)
+        return axes
+
+    def _permutation(self, operation: np.ndarray):
+        """
+        :param operation: ndarray, orthogonal matrix of the operation
+        :return: tuple, permutation of nuclei if operation is symmetry of the molecule, otherwise None
+        """
+        transformed = self.coordinates @ operation.T
+        distances = np.sqrt(np.sum((transformed[:, None, :] - self.coordinates[None, :, :]) ** 2, axis=2))
+        distances[self.molecule.atomic_numbers[:, None] != self.molecule.atomic_numbers[None, :]] = np.inf
+        permutation = np.argmin(distances, axis=1)
+        if np.all(distances[np.arange(len(permutation)), permutation] < self.tolerance) \
+                and len(set(permutation)) == len(permutation):
+            return tuple(int(p) for p in permutation)
+        return None
+
+    def _find_elements(self) -> List:
+        """
+        Testing of candidate operations
+        :return: list of symmetry elements (kind, order, axis, permutation of nuclei),
+                 kind is one of "E", "C", "S", "sigma", "i"
+        """
+        identity = tuple(range(len(self.coordinates)))
+        elements = [("E", 1, None, identity)]
+        inversion = self._permutation(-np.identity(3))
+        if inversion is not None:
+            elements.append(("i", 2, None, inversion))
+        for axis in self._candidate_axes():
+            permutation = self._permutation(self.reflection(axis))
+            if permutation is not None:
+                elements.append(("sigma", 1, axis, permutation))
+            for n in range(2, self.max_order + 1):
+                permutation = self._permutation(self.rotation(axis, 2 * np.pi / n))
+                if permutation is not None:
+                    elements.append(("C", n, axis, permutation))
+            for n in range(3, 2 * self.max_order + 1):
+                permutation = self._permutation(self.reflection(axis) @ self.rotation(axis, 2 * np.pi / n))
+                if permutation is not None:
+                    elements.append(("S", n, axis, permutation))
+        return elements
+
+    @staticmethod
+    def _close_permutations(permutations: List) -> np.ndarray:
+        """
+        Permutations of nuclei are closed under composition, so that they form a group
+        :param permutations: list of tuples, permutations of nuclei
+        :return: ndarray, array.shape = (number of distinct permutations, number of nuclei)
+        """
+        group = set(permutations)
+        new = set(permutations)
+        while new:
+            products = {tuple(p[q_i] for q_i in q) for p in group for q in new} | \
+                       {tuple(q[p_i] for p_i in p) for p in group for q in new}
+            new = products - group
+            group |= new
+        return np.array(sorted(group))
+
+    def _axes_of(self, kind: str, order: int) -> List[np.ndarray]:
+        return [axis for element_kind, n, axis, _ in self.elements if element_kind == kind and n == order]
+
+    def _classify(self) -> str:
+        """
+        Schoenflies symbol of the point group according to the usual flowchart
+        :return: str
+        """
+        has_inversion = any(kind == "i" for kind, _, _, _ in self.elements)
+        mirrors = self._axes_of("sigma", 1)
+        if np.linalg.matrix_rank(self.coordinates, tol=self.tolerance) <= 1:
+            return "Dinfh" if has_inversion else "Cinfv"
+        if len(self._axes_of("C", 3)) >= 2:
+            if self._axes_of("C", 5):
+                return "Ih" if has_inversion else "I"
+            if self._axes_of("C", 4):
+                return "Oh" if has_inversion else "O"
+            if has_inversion:
+                return "Th"
+            return "Td" if mirrors else "T"
+        orders = [n for kind, n, _, _ in self.elements if kind == "C"]
+        if not orders:
+            if mirrors:
+                return "Cs"
+            return "Ci" if has_inversion else "C1"
+        n = max(orders)
+        principal = self._axes_of("C", n)[0]
+        perpendicular_C2 = [axis for axis in self._axes_of("C", 2) if abs(axis @ principal) < self.tolerance]
+        horizontal_mirror = any(abs(abs(normal @ principal) - 1) < self.tolerance for normal in mirrors)
+        vertical_mirror = any(abs(normal @ principal) < self.tolerance for normal in mirrors)
+        if len(perpendicular_C2) >= n:
+            if horizontal_mirror:
+                return f"D{n}h"
+            return f"D{n}d" if vertical_mirror else f"D{n}"
+        if horizontal_mirror:
+            return f"C{n}h"
+        if vertical_mirror:
+            return f"C{n}v"
+        if any(abs(abs(axis @ principal) - 1) < self.tolerance for axis in self._axes_of("S", 2 * n)):
+            return f"S{2 * n}"
+        return f"C{n}"
+
+    def basis_permutations(self, basis: RootBasis) -> np.ndarray:
+        """
+        Permutations of basis functions induced by permutations of nuclei
+        k-th function centered on nucleus a is mapped to k-th function centered on the image of nucleus a,
+        therefore symmetry equivalent nuclei have to carry the same functions in the same order
+        with the same normalization factors, otherwise only identity permutation is returned
+        Basis functions are assumed to be spherically symmetric around their centers (s-type)
+        :param basis: RootBasis (parent class), object representing basis set used for calculation
+        :return: ndarray, array.shape = (number of permutations, len(basis))
+        """
+        identity = np.arange(len(basis))[None, :]
+        if not basis.is_centered_on(self.molecule.nuclei_positions, self.tolerance):
+            SCF_logger.info("Basis is not centered on nuclei of the molecule: symmetry is not used")
+            return identity
+        centers = basis.center_indices()
+        normalization_factors = np.array(basis.normalization_factors, dtype=float).flatten()
+        functions_of_center = [np.flatnonzero(centers == a) for a in range(len(self.coordinates))]
+        permutations = []
+        for atom_permutation in self.atom_permutations:
+            permutation = np.zeros(len(basis), dtype=int)
+            for a, b in enumerate(atom_permutation):
+                if len(functions_of_center[a]) != len(functions_of_center[b]):
+                    SCF_logger.info("Symmetry equivalent nuclei carry different basis functions: symmetry is not used")
+                    return identity
+                if not np.allclose(normalization_factors[functions_of_center[a]],
+                                   normalization_factors[functions_of_center[b]]):
+                    SCF_logger.info("Symmetry equivalent nuclei carry differently normalized basis functions: "
+                                    "symmetry is not used")
+                    return identity
+                permutation[functions_of_center[a]] = functions_of_center[b]
+            permutations.append(permutation)
+        return np.array(permutations)
+
+
+def pair_orbits(permutations: np.ndarray) -> Iterator[Tuple]:
+    """
+    Orbits of elements [i, j] of symmetric one electron matrix under permutations of basis functions
+    and transposition, every orbit is yielded once for its representative (the smallest i*len(basis) + j)
+    Orbits are enumerated element by element, no table of len(basis)**2 indices is allocated
+    :param permutations: ndarray, permutations of basis functions array.shape = (number of permutations, len(basis))
+    :return: iterator of (i, j, orbit), orbit is tuple of index arrays of all elements equivalent to [i, j]
+    """
+    n = permutations.shape[1]
+    for i in range(n):
+        for j in range(i, n):
+            a = np.minimum(permutations[:, i], permutations[:, j])
+            b = np.maximum(permutations[:, i], permutations[:, j])
+            if np.min(a * n + b) < i * n + j:
+                continue
+            yield i, j, (np.concatenate([a, b]), np.concatenate([b, a]))
+
+
+def quartet_orbits(permutations: np.ndarray) -> Iterator[Tuple]:
+    """
+    Orbits of elements [i, j, k, l] of two electron interaction matrix under permutations of basis functions
+    and 8-fold permutational symmetry of mnls, every orbit is yielded once for its representative
+    (the smallest flat index among canonical quartets i <= j, k <= l, i*len(basis) + j <= k*len(basis) + l)
+    Orbits are enumerated quartet by quartet, no table of len(basis)**4 indices is allocated
+    :param permutations: ndarray, permutations of basis functions array.shape = (number of permutations, len(basis))
+    :return: iterator of (i, j, k, l, orbit), orbit is tuple of index arrays of all elements equivalent to [i, j, k, l]
+    """
+    n = permutations.shape[1]
+    for i in range(n):
+        for j in range(i, n):
+            a = np.minimum(permutations[:, i], permutations[:, j])
+            b = np.maximum(permutations[:, i], permutations[:, j])
+            for k in range(i, n):
+                for l in range(j if k == i else k, n):
+                    c = np.minimum(permutations[:, k], permutations[:, l])
+                    d = np.maximum(permutations[:, k], permutations[:, l])
+                    ab, cd = a * n + b, c * n + d
+                    if np.min(np.minimum(ab, cd) * n ** 2 + np.maximum(ab, cd)) < (i * n + j) * n ** 2 + k * n + l:
+                        continue
+                    yield i, j, k, l, (np.concatenate([a, b, a, b, c, d, c, d]),
+                                       np.concatenate([b, a, b, a, d, c, d, c]),
+                                       np.concatenate([c, c, d, d, a, a, b, b]),
+                                       np.concatenate([d, d, c, c, b, b, a, a]))
@@ -5,8 +5,13 @@ from SCF_method.calculation.basis.basis_mapping import BASIS_TYPE_MAPPING
 from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
 from SCF_method.calculation.convergence.convergence_config import ConvergenceConfig
 from SCF_method.calculation.integration.integrator_mapping import INTEGRATOR_TYPE_MAPPING
+from SCF_method.calculation.integration.sample_pool import SamplePool
+from SCF_method.calculation.matrices.precalculated.precalculated_integrals import PrecalculatedIntegrals
 from SCF_method.calculation.molecules.molecule import Molecule
+from SCF_method.calculation.optimization.geometry_optimizer import GeometryOptimizer
+from SCF_method.calculation.optimization.optimization_config import OptimizationConfig
 from SCF_method.calculation.procedure import SelfConsistentFieldProcedure
+from SCF_method.input_validation import validate_input
 from SCF_method.logger import SCF_logger
 
 
@@ -21,25 +26,47 @@ class ExecutorSCF:
         :param input_dict: Dict: dictionary of transformed data from input json
         """
         SCF_logger.info("Preparing input data")
+        errors = validate_input(input_dict)
+        if errors:
+            raise ValueError("Invalid input data: " + "; ".join(errors))
         SCF_logger.info("Initializing molecule")
         self.molecule = Molecule(**input_dict['molecule_definition'])
         SCF_logger.info("Initializing basis set")
         self.basis = BASIS_TYPE_MAPPING[input_dict['basis']['type']](**input_dict['basis']['params'])
+        SCF_logger.info("Initializing sample pool")
+        self.sample_pool = SamplePool(
+            n_samples=input_dict['integration_config']['n_samples'],
+            boundaries=input_dict['integration_config']['boundaries'],
+            dimensions=6,
+            seed=input_dict['integration_config'].get('seed'),
+            path=input_dict['integration_config'].get('sample_pool_path')
+        )
         SCF_logger.info("Initializing integrators")
         self.integrator_3D = INTEGRATOR_TYPE_MAPPING[input_dict['integration_config']['type']](
             n_samples=input_dict['integration_config']['n_samples'],
             boundaries=input_dict['integration_config']['boundaries'],
-            dimensions=3
+            dimensions=3,
+            sample_pool=self.sample_pool
         )
         self.integrator_6D = INTEGRATOR_TYPE_MAPPING[input_dict['integration_config']['type']](
             n_samples=input_dict['integration_config']['n_samples'],
             boundaries=input_dict['integration_config']['boundaries'],
-            dimensions=6
+            dimensions=6,
+            sample_pool=self.sample_pool
         )
         if "convergence_config" in input_dict.keys():
             self.convergence_config = ConvergenceConfig(**input_dict["convergence_config"])
         else:
             self.convergence_config = ConvergenceConfig()
+        if "optimization_config" in input_dict.keys():
+            self.optimization_config = OptimizationConfig(**input_dict["optimization_config"])
+        else:
+            self.optimization_config = OptimizationConfig()
+        if "precalculated_integrals_path" in input_dict.keys():
+            self.precalculated_integrals = PrecalculatedIntegrals(input_dict["precalculated_integrals_path"])
+        else:
+            self.precalculated_integrals = None
+        self.use_symmetry = input_dict.get("use_symmetry", False)
 
     def run_calculation(self) -> SelfConsistentFieldCalculation:
 
@@ -47,8 +74,25 @@ class ExecutorSCF:
                                                      input_molecule=self.molecule,
                                                      integrator_3D=self.integrator_3D,
                                                      integrator_6D=self.integrator_6D,
-                                                     convergence_config=self.convergence_config)
+                                                     convergence_config=self.convergence_config,
+                                                     precalculated_integrals=self.precalculated_integrals,
+                                                     use_symmetry=self.use_symmetry)
 
         SCF_obj = SCF_procedure.calculate()
         SCF_logger.info("SCF procedure succesfull")
         return SCF_obj
+
+    def run_geometry_optimization(self) -> SelfConsistentFieldCalculation:
+
+        optimizer = GeometryOptimizer(input_basis=self.basis,
+                                      input_molecule=self.molecule,
+                                      integrator_3D=self.integrator_3D,
+                                      integrator_6D=self.integrator_6D,
+                                      convergence_config=self.convergence_config,
+                                      optimization_config=self.optimization_config,
+                                      use_symmetry=self.use_symmetry)
+
+        SCF_obj = optimizer.optimize()
+        self.optimizer = optimizer
+        SCF_logger.info("Geometry optimization succesfull")
+        return SCF_obj
@@ -0,0 +1,140 @@
+"""
+Command line interface for running SCF calculations from input json files:
+    python -m SCF_method input.json [input.json ...] [--output-dir DIR] [--dry-run] [--optimize] [--mp2]
+Calculation modules (and numpy) are imported only when a calculation is really executed,
+all inputs are validated before the first calculation starts
+"""
+import argparse
+import json
+import os
+import sys
+import traceback
+from typing import Dict, List
+
+from SCF_method.input_validation import estimate_resources, validate_input
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"has to be a positive integer, got {value}")
+    return number
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m SCF_method",
+                                     description="Self consistent field calculation from input json files")
+    parser.add_argument("inputs", nargs="+", help="input json files")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for result files, default is the directory of the input file")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="validate inputs and estimate memory and time without calculation")
+    parser.add_argument("--optimize", action="store_true",
+                        help="run geometry optimization instead of single point calculation")
+    parser.add_argument("--mp2", action="store_true",
+                        help="calculate MP2 correlation energy after SCF procedure")
+    parser.add_argument("--mp2-block-size", type=_positive_int, default=None,
+                        help="number of occupied orbitals transformed at once in MP2 calculation")
+    parser.add_argument("--save-integrals", default=None,
+                        help="directory where calculated integrals are stored for reuse")
+    return parser.parse_args(argv)
+
+
+def _load_inputs(paths: List[str]) -> Dict:
+    """
+    Loads and validates all input files
+    :param paths: list of paths to input json files
+    :return: Dict of input dictionaries by path, None if any of inputs is invalid
+    """
+    inputs = {}
+    valid = True
+    for path in paths:
+        try:
+            with open(path) as input_file:
+                input_dict = json.load(input_file)
+        except (OSError, ValueError) as error:
+            print(f"{path}: {error}", file=sys.stderr)
+            valid = False
+            continue
+        errors = validate_input(input_dict)
+        for error in errors:
+            print(f"{path}: {error}", file=sys.stderr)
+        valid = valid and not errors
+        inputs[path] = input_dict
+    return inputs if valid else None
+
+
+def _output_path(input_path: str, output_dir: str) -> str:
+    name = os.path.splitext(os.path.basename(input_path))[0] + "_result.json"
+    return os.path.join(output_dir if output_dir is not None else os.path.dirname(input_path), name)
+
+
+def _run(input_dict: Dict, args: argparse.Namespace) -> Dict:
+    """
+    Execution of calculation itself, heavy modules are imported here
+    :param input_dict: Dict: dictionary of transformed data from input json
+    :param args: argparse.Namespace, parsed command line arguments
+    :return: Dict, summary of the calculation
+    """
+    from SCF_method.calculation_executor import ExecutorSCF
+    from SCF_method.output_handler import OutputHandlerSCF
+
+    executor = ExecutorSCF(input_dict)
+    if args.optimize:
+        SCF_obj = executor.run_geometry_optimization()
+    else:
+        SCF_obj = executor.run_calculation()
+    if args.save_integrals is not None:
+        from SCF_method.calculation.matrices.precalculated.precalculated_integrals import PrecalculatedIntegrals
+        fingerprint = PrecalculatedIntegrals.fingerprint(executor.molecule,
+                                                         executor.basis,
+                                                         executor.integrator_3D,
+                                                         executor.integrator_6D)
+        PrecalculatedIntegrals.save(args.save_integrals, SCF_obj, executor.basis, fingerprint)
+
+    output_handler = OutputHandlerSCF(SCF_obj, executor.basis)
+    result = output_handler.summary()
+    result["nuclear_repulsion_energy"] = float(executor.molecule.nuclear_repulsion_energy())
+    result["total_energy"] = result["electronic_energy"] + result["nuclear_repulsion_energy"]
+    result["nuclei_positions"] = executor.molecule.nuclei_positions.tolist()
+    if args.mp2:
+        result["mp2_correlation_energy"] = float(output_handler.mp2_energy(args.mp2_block_size))
+        result["mp2_total_energy"] = result["total_energy"] + result["mp2_correlation_energy"]
+    if args.optimize:
+        result["optimization_energies"] = [float(energy) for energy in executor.optimizer.energies]
+        result["gradient"] = executor.optimizer.gradients[-1].tolist()
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.save_integrals is not None and len(args.inputs) > 1:
+        print("--save-integrals can be used only with a single input", file=sys.stderr)
+        return 2
+    inputs = _load_inputs(args.inputs)
+    if inputs is None:
+        return 1
+
+    if args.dry_run:
+        for path, input_dict in inputs.items():
+            estimate = estimate_resources(input_dict, optimize=args.optimize, mp2=args.mp2,
+                                          mp2_block_size=args.mp2_block_size)
+            print(json.dumps({"input": path, **estimate}, indent=4))
+        return 0
+
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+    failed = []
+    for path, input_dict in inputs.items():
+        try:
+            result = _run(input_dict, args)
+            with open(_output_path(path, args.output_dir), "w") as output_file:
+                json.dump({"input": path, **result}, output_file, indent=4)
+        except Exception as error:
+            traceback.print_exc(file=sys.stderr)
+            print(f"{path}: calculation failed: {type(error).__name__}: {error}", file=sys.stderr)
+            failed.append(path)
+    if failed:
+        print(f"{len(failed)} of {len(inputs)} calculations failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
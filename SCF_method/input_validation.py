@@ -0,0 +1,239 @@
+"""
+This module is used for validation of input dictionary (transformed input json file)
+before any integrator or matrix is allocated
+It does not import numpy or calculation modules, so it is cheap to import
+Known types have to be kept in sync with BASIS_TYPE_MAPPING and INTEGRATOR_TYPE_MAPPING
+"""
+from numbers import Number
+from typing import Dict, List
+
+from SCF_method.calculation.optimization.optimization_config import OptimizationConfig
+
+BASIS_PARAMS = {
+    "gaussian": {"alphas", "nuclei_positions", "normalization_factors"}
+}
+
+INTEGRATION_PARAMS = {
+    "MC": {"type", "n_samples", "boundaries", "seed", "sample_pool_path"}
+}
+
+CONVERGENCE_PARAMS = {
+    "max_iteration": "positive integer",
+    "averaging": "boolean",
+    "delta": "positive number"
+}
+
+OPTIMIZATION_PARAMS = {
+    "max_iteration": "positive integer",
+    "gradient_tolerance": "positive number",
+    "max_step": "positive number"
+}
+
+INPUT_KEYS = {"molecule_definition", "basis", "integration_config", "convergence_config",
+              "optimization_config", "precalculated_integrals_path", "use_symmetry"}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _has_type(value, expected: str) -> bool:
+    if expected == "positive integer":
+        return _is_int(value) and value > 0
+    if expected == "positive number":
+        return _is_number(value) and value > 0
+    return isinstance(value, bool)
+
+
+def _validate_config(config: Dict, params: Dict, name: str) -> List[str]:
+    errors = _validate_keys(config, set(params), name)
+    if not isinstance(config, dict):
+        return errors
+    return errors + [f"{name}.{key} has to be a {expected}" for key, expected in params.items()
+                     if key in config and not _has_type(config[key], expected)]
+
+
+def _validate_positions(positions, name: str) -> List[str]:
+    if not isinstance(positions, list) or not positions:
+        return [f"{name} has to be a non empty list of coordinates"]
+    if not all(isinstance(R, list) and len(R) == 3 and all(_is_number(x) for x in R) for R in positions):
+        return [f"{name} has to contain lists of 3 numbers"]
+    return []
+
+
+def _validate_keys(section: Dict, allowed: set, name: str) -> List[str]:
+    if not isinstance(section, dict):
+        return [f"{name} has to be a dictionary"]
+    return [f"unknown key '{key}' in {name}" for key in sorted(set(section) - allowed)]
+
+
+def _validate_molecule(molecule: Dict, basis_length: int = None) -> List[str]:
+    required = {"nuclei_positions", "atomic_numbers", "number_of_electrons"}
+    errors = _validate_keys(molecule, required, "molecule_definition")
+    if errors and not isinstance(molecule, dict):
+        return errors
+    errors += [f"missing key '{key}' in molecule_definition" for key in sorted(required - set(molecule))]
+    if errors:
+        return errors
+    errors += _validate_positions(molecule["nuclei_positions"], "molecule_definition.nuclei_positions")
+    atomic_numbers = molecule["atomic_numbers"]
+    if not isinstance(atomic_numbers, list) or not all(_is_int(Z) and Z > 0 for Z in atomic_numbers):
+        errors.append("molecule_definition.atomic_numbers has to be a list of positive integers")
+    elif len(atomic_numbers) != len(molecule["nuclei_positions"]):
+        errors.append("molecule_definition.atomic_numbers and nuclei_positions have different lengths")
+    N = molecule["number_of_electrons"]
+    if not _is_int(N) or N <= 0 or N % 2:
+        errors.append("molecule_definition.number_of_electrons has to be a positive even integer "
+                      "(closed shell calculation)")
+    elif basis_length is not None and N // 2 > basis_length:
+        errors.append(f"molecule_definition.number_of_electrons requires {N // 2} occupied orbitals, "
+                      f"basis has only {basis_length} functions")
+    return errors
+
+
+def _validate_basis(basis: Dict) -> List[str]:
+    errors = _validate_keys(basis, {"type", "params"}, "basis")
+    if errors:
+        return errors
+    if basis.get("type") not in BASIS_PARAMS:
+        return [f"basis.type has to be one of {sorted(BASIS_PARAMS)}"]
+    params = basis.get("params")
+    errors = _validate_keys(params, BASIS_PARAMS[basis["type"]], "basis.params")
+    if errors and not isinstance(params, dict):
+        return errors
+    errors += [f"missing key '{key}' in basis.params" for key in sorted(BASIS_PARAMS[basis["type"]] - set(params))]
+    if errors:
+        return errors
+    if basis["type"] == "gaussian":
+        alphas = params["alphas"]
+        if not isinstance(alphas, list) or not alphas or not all(_is_number(a) and a > 0 for a in alphas):
+            errors.append("basis.params.alphas has to be a non empty list of positive numbers")
+        errors += _validate_positions(params["nuclei_positions"], "basis.params.nuclei_positions")
+        factors = params["normalization_factors"]
+        if errors:
+            return errors
+        if (not isinstance(factors, list) or len(factors) != len(params["nuclei_positions"])
+                or not all(isinstance(f, list) and len(f) == len(alphas) and all(_is_number(x) for x in f)
+                           for f in factors)):
+            errors.append("basis.params.normalization_factors has to be a list of "
+                          "len(alphas) numbers for each nucleus")
+    return errors
+
+
+def _validate_integration(integration_config: Dict) -> List[str]:
+    if not isinstance(integration_config, dict):
+        return ["integration_config has to be a dictionary"]
+    if integration_config.get("type") not in INTEGRATION_PARAMS:
+        return [f"integration_config.type has to be one of {sorted(INTEGRATION_PARAMS)}"]
+    errors = _validate_keys(integration_config, INTEGRATION_PARAMS[integration_config["type"]], "integration_config")
+    n_samples = integration_config.get("n_samples")
+    if not _is_int(n_samples) or n_samples <= 0:
+        errors.append("integration_config.n_samples has to be a positive integer")
+    boundaries = integration_config.get("boundaries")
+    if (not isinstance(boundaries, list) or len(boundaries) != 2 or not all(_is_number(b) for b in boundaries)
+            or boundaries[0] >= boundaries[1]):
+        errors.append("integration_config.boundaries has to be a list [lower, upper] with lower < upper")
+    if "seed" in integration_config and not (integration_config["seed"] is None or _is_int(integration_config["seed"])):
+        errors.append("integration_config.seed has to be an integer")
+    if "sample_pool_path" in integration_config and not isinstance(integration_config["sample_pool_path"], str):
+        errors.append("integration_config.sample_pool_path has to be a string")
+    return errors
+
+
+def validate_input(input_dict: Dict) -> List[str]:
+    """
+    Validation of the structure and types of input dictionary
+    :param input_dict: Dict: dictionary of transformed data from input json
+    :return: list of error messages, empty list for valid input
+    """
+    if not isinstance(input_dict, dict):
+        return ["input has to be a dictionary"]
+    errors = [f"unknown key '{key}' in input" for key in sorted(set(input_dict) - INPUT_KEYS)]
+    for key in ("molecule_definition", "basis", "integration_config"):
+        if key not in input_dict:
+            errors.append(f"missing key '{key}' in input")
+    if errors:
+        return errors
+    basis_errors = _validate_basis(input_dict["basis"])
+    basis_length = None
+    if not basis_errors:
+        params = input_dict["basis"]["params"]
+        basis_length = len(params["nuclei_positions"]) * len(params["alphas"])
+    errors += _validate_molecule(input_dict["molecule_definition"], basis_length)
+    errors += basis_errors
+    errors += _validate_integration(input_dict["integration_config"])
+    if "convergence_config" in input_dict:
+        errors += _validate_config(input_dict["convergence_config"], CONVERGENCE_PARAMS, "convergence_config")
+    if "optimization_config" in input_dict:
+        errors += _validate_config(input_dict["optimization_config"], OPTIMIZATION_PARAMS, "optimization_config")
+    if "precalculated_integrals_path" in input_dict and not isinstance(input_dict["precalculated_integrals_path"], str):
+        errors.append("precalculated_integrals_path has to be a string")
+    if "use_symmetry" in input_dict and not isinstance(input_dict["use_symmetry"], bool):
+        errors.append("use_symmetry has to be a boolean")
+    return errors
+
+
+def estimate_resources(input_dict: Dict, optimize: bool = False, mp2: bool = False, mp2_block_size: int = None) -> Dict:
+    """
+    Rough estimate of memory and time of the calculation from basis size and number of samples
+    Time constants and peak size of integrand temporaries were measured for Monte Carlo integration
+    of gaussian basis with numpy and should be considered as order of magnitude
+    Geometry optimization is estimated for the maximal number of steps, each step integrates SCF matrices
+    and derivative integrals of the nuclear gradient
+    With symmetry only symmetry unique integrals are calculated, the point group is not known before
+    the calculation, therefore numbers of integrals are upper bounds
+    :param input_dict: Dict: dictionary of transformed data from valid input json
+    :param optimize: bool, whether geometry optimization is run instead of single point calculation
+    :param mp2: bool, whether MP2 correlation energy is calculated
+    :param mp2_block_size: int, number of occupied orbitals transformed at once in MP2 calculation
+    :return: Dict with basis size, number of integrals, memory in bytes and time in seconds
+    """
+    seconds_per_sample = {"S": 6e-8, "T": 4e-7, "V_nuc": 1e-7, "mnls": 2e-7,
+                          "dS": 6e-8, "dT": 4e-7, "dV_nuc": 1e-7, "dV_operator": 1e-7, "dmnls": 4e-7}
+    flops_per_second = 1e9
+    params = input_dict["basis"]["params"]
+    n_nuclei = len(params["nuclei_positions"])
+    basis_length = n_nuclei * len(params["alphas"])
+    n_samples = input_dict["integration_config"]["n_samples"]
+    pairs = basis_length * (basis_length + 1) // 2
+    quartets = pairs * (pairs + 1) // 2
+    n_integrals = {"S": pairs, "T": pairs, "V_nuc": pairs, "mnls": quartets}
+    float_size = 8
+    memory = {
+        "sample_pool": n_samples * 6 * float_size,
+        "integrand_temporaries": n_samples * 10 * float_size,
+        "mnls": basis_length ** 4 * float_size
+    }
+    steps = 1
+    if optimize:
+        n_integrals.update({
+            "dS": 3 * basis_length ** 2,
+            "dT": 6 * pairs,
+            "dV_nuc": 3 * basis_length ** 2,
+            "dV_operator": 3 * n_nuclei * pairs,
+            "dmnls": 3 * quartets * min(4, n_nuclei)
+        })
+        memory["two_electron_density"] = basis_length ** 4 * float_size
+        steps = input_dict.get("optimization_config", {}).get("max_iteration", OptimizationConfig().max_iteration) + 1
+    time = {name: steps * n * n_samples * seconds_per_sample[name] for name, n in n_integrals.items()}
+    if mp2:
+        n_occupied = input_dict["molecule_definition"]["number_of_electrons"] // 2
+        block_size = min(mp2_block_size, n_occupied) if mp2_block_size else n_occupied
+        memory["mp2_transformation"] = 2 * block_size * basis_length ** 3 * float_size
+        time["mp2"] = 2 * n_occupied * basis_length ** 4 / flops_per_second
+    return {
+        "basis_length": basis_length,
+        "n_samples": n_samples,
+        "calculation": "geometry optimization" if optimize else "single point",
+        "steps": steps,
+        "use_symmetry": bool(input_dict.get("use_symmetry", False)),
+        "n_integrals": n_integrals,
+        "memory_bytes": memory,
+        "total_memory_bytes": sum(memory.values()),
+        "time_seconds": time,
+        "total_time_seconds": sum(time.values())
+    }
@@ -1,9 +1,10 @@
-from typing import Callable
+from typing import Callable, Dict
 
 import numpy as np
 
 from SCF_method.calculation.basis.basis_functions import RootBasis
 from SCF_method.calculation.calculation_iterator import SelfConsistentFieldCalculation
+from SCF_method.calculation.correlation.mp2 import MollerPlessetEnergy
 
 
 class OutputHandlerSCF:
@@ -45,6 +46,28 @@ class OutputHandlerSCF:
         """
         return self.SCF_obj.C
 
+    def mp2_energy(self, block_size: int = None) -> float:
+        """
+        :param block_size: int, number of occupied orbitals transformed at once, all of them if None
+        :return: float, MP2 correlation energy
+        """
+        return MollerPlessetEnergy(self.SCF_obj, block_size).energy
+
+    def summary(self) -> Dict:
+        """
+        Summary of the calculation in the form which can be written to json file
+        :return: Dict
+        """
+        return {
+            "iterations": self.SCF_obj.iteration,
+            "electronic_energy": float(np.real(self.SCF_obj.electronic_energy())),
+            "electron_energies": np.real(self.electron_energies()).tolist(),
+            "electron_density_matrix": self.electron_density_matrix().tolist(),
+            "fock_matrix": self.fock_matrix().tolist(),
+            "coeff_matrix": np.real(self.coeff_matrix()).tolist(),
+            "normalization_factors": self.basis.normalization_factors.tolist()
+        }
+
     def electron_density(self) -> Callable:
         """
         Calculates electron density as a function of coordinates